@@ -46,6 +46,8 @@ class AppConfig:
     LOG_FILE: str = "app.log"
     LOG_ROTATION: str = "10 MB"  # Ротация при достижении размера
     LOG_RETENTION: str = "30 days"  # Хранить логи 30 дней
+    LOG_BACKTRACE: bool = False  # Расширенный traceback (кадры выше точки перехвата)
+    LOG_DIAGNOSE: bool = False  # Значения переменных в traceback (только консоль)
     LOG_FORMAT: str = (
         "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
         "<level>{level: <8}</level> | "
@@ -10,6 +10,25 @@ from ..utils.icons import Icon
 
 logger = get_logger(__name__)
 
+# Блоки in(поле, значения...) в SpEL-условии и целые числа внутри них
+_IN_BLOCK_RE = re.compile(r'in\([^,]+,\s*([0-9,\s]+)\)')
+_INT_RE = re.compile(r'\b\d+\b')
+
+# Человекочитаемые названия ограничений (_analyze_constraint_changes)
+_CONSTRAINT_NAMES = {
+    "minLength": "Минимальная длина",
+    "maxLength": "Максимальная длина",
+    "minimum": "Минимальное значение",
+    "maximum": "Максимальное значение",
+    "maxIntLength": "Максимальная длина целой части",
+    "minItems": "Минимальное количество элементов",
+    "maxItems": "Максимальное количество элементов",
+    "pattern": "Регулярное выражение"
+}
+
+# Нижние границы: рост значения ужесточает ограничение (у верхних — наоборот)
+_LOWER_BOUND_CONSTRAINTS = frozenset({"minLength", "minimum", "minItems"})
+
 
 class SchemaComparator:
     """
@@ -87,42 +106,33 @@ class SchemaComparator:
         
         logger.info(f"{Icon.MODIFICATION} Сравнение схем: {old_label} → {new_label}")
 
-        all_paths = set(old_schema.keys()) | set(new_schema.keys())
+        # Один последовательный проход по каждой схеме (порядок изменений = порядок
+        # полей; пул процессов дороже самого сравнения). FieldChange создается
+        # позиционно: (path, change_type, old_meta, new_meta, changes)
+        field_change = FieldChange
+        fields_differ = self._fields_differ
+
+        added_fields = [
+            field_change(path, "added", None, new_field)
+            for path, new_field in new_schema.items()
+            if path not in old_schema
+        ]
 
-        added_fields = []
         removed_fields = []
         modified_fields = []
+        append_removed = removed_fields.append
+        append_modified = modified_fields.append
 
-        for path in all_paths:
-            old_field = old_schema.get(path)
+        for path, old_field in old_schema.items():
             new_field = new_schema.get(path)
 
-            if old_field is None:
-                # Поле добавлено
-                added_fields.append(FieldChange(
-                    path=path,
-                    change_type="added",
-                    old_meta=None,
-                    new_meta=new_field
-                ))
-            elif new_field is None:
+            if new_field is None:
                 # Поле удалено
-                removed_fields.append(FieldChange(
-                    path=path,
-                    change_type="removed",
-                    old_meta=old_field,
-                    new_meta=None
-                ))
-            elif self._fields_differ(old_field, new_field):
+                append_removed(field_change(path, "removed", old_field, None))
+            elif fields_differ(old_field, new_field):
                 # Поле изменено
                 changes = self._detect_field_changes(old_field, new_field)
-                modified_fields.append(FieldChange(
-                    path=path,
-                    change_type="modified",
-                    old_meta=old_field,
-                    new_meta=new_field,
-                    changes=changes
-                ))
+                append_modified(field_change(path, "modified", old_field, new_field, changes))
 
         logger.info(
             f"{Icon.STAT} Изменения: +{len(added_fields)} полей, "
@@ -233,12 +243,11 @@ class SchemaComparator:
                 f"Справочник изменился: '{old_field.dictionary}' → '{new_field.dictionary}'"
             )
 
-        # Изменение ограничений
-        if old_field.constraints != new_field.constraints:
-            constraint_desc = self._analyze_constraint_changes(
-                old_field.constraints,
-                new_field.constraints
-            )
+        # Изменение ограничений (dict: сравнение не зависит от порядка ключей)
+        old_constraints = old_field.constraints
+        new_constraints = new_field.constraints
+        if old_constraints != new_constraints:
+            constraint_desc = self._analyze_constraint_changes(old_constraints, new_constraints)
             if constraint_desc:
                 changes["constraints"] = constraint_desc
 
@@ -293,19 +302,14 @@ class SchemaComparator:
         # Пытаемся найти только изменения в списках значений in(...)
 
         # Ищем все конструкции in(..., значения, ...)
-        old_in_blocks = re.findall(r'in\([^,]+,\s*([0-9,\s]+)\)', old_expr)
-        new_in_blocks = re.findall(r'in\([^,]+,\s*([0-9,\s]+)\)', new_expr)
+        old_in_blocks = _IN_BLOCK_RE.findall(old_expr)
+        new_in_blocks = _IN_BLOCK_RE.findall(new_expr)
 
         if old_in_blocks and new_in_blocks:
-            # Извлекаем числа из первого найденного блока
-            old_values = set()
-            new_values = set()
-
-            for block in old_in_blocks:
-                old_values.update(re.findall(r'\b\d+\b', block))
-
-            for block in new_in_blocks:
-                new_values.update(re.findall(r'\b\d+\b', block))
+            # Извлекаем числа из всех найденных блоков
+            find_ints = _INT_RE.findall
+            old_values = {value for block in old_in_blocks for value in find_ints(block)}
+            new_values = {value for block in new_in_blocks for value in find_ints(block)}
 
             added_values = new_values - old_values
             removed_values = old_values - new_values
@@ -369,18 +373,10 @@ class SchemaComparator:
             ... )
             'Максимальная длина ужесточено: 100 → 50'
         """
-        constraint_names = {
-            "minLength": "Минимальная длина",
-            "maxLength": "Максимальная длина",
-            "minimum": "Минимальное значение",
-            "maximum": "Максимальное значение",
-            "maxIntLength": "Максимальная длина целой части",
-            "minItems": "Минимальное количество элементов",
-            "maxItems": "Максимальное количество элементов",
-            "pattern": "Регулярное выражение"
-        }
-
-        all_keys = set(old_constraints.keys()) | set(new_constraints.keys())
+        # Ключи старых ограничений, затем новые: порядок описания не зависит
+        # от хеширования строк (в отличие от объединения множеств)
+        all_keys = list(old_constraints)
+        all_keys.extend(key for key in new_constraints if key not in old_constraints)
         changes = []
 
         for key in all_keys:
@@ -391,14 +387,14 @@ class SchemaComparator:
             new_val = new_constraints.get(key)
 
             if old_val != new_val:
-                name = constraint_names.get(key, key)
+                name = _CONSTRAINT_NAMES.get(key, key)
 
                 if old_val is None:
                     changes.append(f"{name} добавлено: {new_val}")
                 elif new_val is None:
                     changes.append(f"{name} удалено (было: {old_val})")
                 elif isinstance(old_val, (int, float)) and isinstance(new_val, (int, float)):
-                    if key in ["minLength", "minimum", "minItems"]:
+                    if key in _LOWER_BOUND_CONSTRAINTS:
                         direction = "ужесточено" if new_val > old_val else "смягчено"
                     else:  # maxLength, maximum, maxItems
                         direction = "ужесточено" if new_val < old_val else "смягчено"
@@ -2,16 +2,24 @@
 Загрузчик справочников из Excel файлов
 Парсит файлы со справочниками и преобразует их в Dictionary модели
 """
+import sys
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
-from src.models.dictionary_models import Dictionary, DictionaryEntry
-from src.utils.excel_utils import load_excel, get_sheet_names
+from src.models.dictionary_models import Dictionary
+from src.utils.excel_utils import (
+    STRING_DTYPE, load_excel, get_sheet_names, iter_excel_chunks
+)
 from src.utils.logger import get_logger
 from src.utils.icons import Icon
 
 logger = get_logger(__name__)
 
+# Лист группового формата + индекс {код_справочника: позиции строк}
+GroupedSheet = Tuple[pd.DataFrame, Dict[Any, np.ndarray]]
+
 
 class DictionaryLoader:
     """
@@ -38,12 +46,31 @@ class DictionaryLoader:
                 sheet_name="All",
                 dictionary_code="CUSTOMER_FLAG"
             )
+
+    Кэш справочников и кэш листов группового формата ограничены
+    (LRU, cache_size элементов): в долгоживущем процессе они не растут
+    бесконечно.
     """
 
-    def __init__(self):
-        """Инициализация загрузчика"""
+    DEFAULT_CACHE_SIZE = 128
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Инициализация загрузчика
+
+        Args:
+            cache_size: Максимальное число элементов в каждом кэше (LRU)
+
+        Raises:
+            ValueError: Если cache_size меньше 1
+        """
+        if cache_size < 1:
+            raise ValueError(f"cache_size должен быть >= 1, получено: {cache_size}")
+
         self.logger = get_logger(self.__class__.__name__)
-        self._cache: Dict[str, Dictionary] = {}
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dictionary]" = OrderedDict()
+        self._group_index: "OrderedDict[Tuple[Any, ...], GroupedSheet]" = OrderedDict()
 
     # ========================================================================
     # ФОРМАТ 1: Классический (один лист = один справочник)
@@ -56,7 +83,8 @@ class DictionaryLoader:
             code_column: str = "Код",
             name_column: str = "Значение",
             description_column: Optional[str] = None,
-            skip_rows: int = 0
+            skip_rows: int = 0,
+            chunksize: Optional[int] = None
     ) -> Dictionary:
         """
         Загрузить справочник из Excel файла (классический формат)
@@ -71,6 +99,8 @@ class DictionaryLoader:
             name_column: Название колонки с значениями
             description_column: Название колонки с описаниями (опционально)
             skip_rows: Количество строк для пропуска (заголовки)
+            chunksize: Размер порции для потокового чтения (None — лист целиком).
+                Для листов на миллионы строк: пиковая память O(chunksize)
 
         Returns:
             Dictionary с загруженными данными
@@ -90,60 +120,54 @@ class DictionaryLoader:
                     name_column="Name"
                 )
         """
-        cache_key = f"{file_path.name}:{sheet_name}"
+        cache_key = self._dictionary_cache_key(
+            self._file_cache_id(file_path),
+            (code_column, name_column, description_column, skip_rows),
+            sheet_name
+        )
 
         # Проверяем кэш
-        if cache_key in self._cache:
+        cached = self._cache_get(self._cache, cache_key)
+        if cached is not None:
             self.logger.info(f"{Icon.PKG} Справочник '{sheet_name}' загружен из кэша")
-            return self._cache[cache_key]
+            return cached
 
         self.logger.info(f"{Icon.DIRECTORY} Загрузка справочника '{sheet_name}' из {file_path.name}")
 
-        # Загружаем Excel
-        df = load_excel(file_path, sheet_name=sheet_name, header=skip_rows)
-
-        # Проверяем наличие обязательных колонок
-        self._validate_columns(df, [code_column, name_column])
+        usecols = [col for col in (code_column, name_column, description_column) if col]
 
         # Создаем Dictionary
         dictionary = Dictionary(name=sheet_name, description=f"Справочник из {file_path.name}")
 
-        # Парсим строки
-        for _, row in df.iterrows():
-            code = row.get(code_column)
-            name = row.get(name_column)
+        if chunksize is None:
+            # Загружаем Excel (только нужные колонки, как строки без вывода типов)
+            chunks = [load_excel(
+                file_path, sheet_name=sheet_name, header=skip_rows,
+                usecols=usecols, dtype=STRING_DTYPE
+            )]
+        else:
+            # Потоковое чтение порциями (openpyxl read_only)
+            chunks = iter_excel_chunks(
+                file_path, sheet_name=sheet_name, header=skip_rows,
+                chunksize=chunksize, usecols=usecols
+            )
 
-            # Пропускаем пустые строки
-            if pd.isna(code) or pd.isna(name):
-                continue
+        for df in chunks:
+            # Проверяем наличие обязательных колонок
+            self._validate_columns(df, [code_column, name_column])
 
-            # Преобразуем типы
-            code = int(code) if isinstance(code, (int, float)) else code
-            if isinstance(code, str):
-                code = int(code.strip())
-            name = str(name).strip()
-
-            # Извлекаем описание (если есть)
-            description = None
-            if description_column and description_column in df.columns:
-                desc_value = row.get(description_column)
-                if not pd.isna(desc_value):
-                    description = str(desc_value).strip()
-
-            # Создаем запись
-            entry = DictionaryEntry(
-                code=code,
-                name=name,
-                dictionary_type=sheet_name,
-                description=description
+            self._append_entries(
+                dictionary, df,
+                code_column=code_column,
+                name_column=name_column,
+                description_column=description_column,
+                dictionary_type=sheet_name
             )
 
-            dictionary.add_entry(entry)
-
         self.logger.info(f"{Icon.SUCCESS} Справочник '{sheet_name}' загружен: {len(dictionary)} записей")
 
         # Кэшируем
-        self._cache[cache_key] = dictionary
+        self._cache_put(self._cache, cache_key, dictionary)
 
         return dictionary
 
@@ -253,24 +277,34 @@ class DictionaryLoader:
                     dictionary_code="CUSTOMER_FLAG"
                 )
         """
-        cache_key = f"{file_path.name}:{sheet_name}:{dictionary_code}"
+        file_id = self._file_cache_id(file_path)
+        cache_key = self._dictionary_cache_key(
+            file_id,
+            (sheet_name, dictionary_code_column, value_code_column, value_name_column, skip_rows),
+            dictionary_code
+        )
 
         # Проверяем кэш
-        if cache_key in self._cache:
+        cached = self._cache_get(self._cache, cache_key)
+        if cached is not None:
             self.logger.info(f"{Icon.PKG} Справочник '{dictionary_code}' загружен из кэша")
-            return self._cache[cache_key]
+            return cached
 
         self.logger.info(f"{Icon.DIRECTORY} Загрузка справочника '{dictionary_code}' из {file_path.name}")
 
-        # Загружаем Excel
-        df = load_excel(file_path, sheet_name=sheet_name, header=skip_rows)
-
-        # Проверяем наличие обязательных колонок
-        required_cols = [dictionary_code_column, value_code_column, value_name_column]
-        self._validate_columns(df, required_cols)
+        # Лист и индекс групп загружаются один раз на все коды справочников
+        df, group_index = self._get_grouped_sheet(
+            file_path, sheet_name,
+            dictionary_code_column=dictionary_code_column,
+            value_code_column=value_code_column,
+            value_name_column=value_name_column,
+            skip_rows=skip_rows,
+            file_id=file_id
+        )
 
-        # Фильтруем по коду справочника
-        filtered_df = df[df[dictionary_code_column] == dictionary_code]
+        # Выбираем строки справочника по готовым позициям (без скана колонки)
+        positions = group_index.get(dictionary_code)
+        filtered_df = df.take(positions) if positions is not None else df.iloc[0:0]
 
         if filtered_df.empty:
             self.logger.warning(f"{Icon.WARNING} Справочник '{dictionary_code}' не найден в листе '{sheet_name}'")
@@ -283,32 +317,17 @@ class DictionaryLoader:
         )
 
         # Парсим строки
-        for _, row in filtered_df.iterrows():
-            code = row.get(value_code_column)
-            name = row.get(value_name_column)
-
-            # Пропускаем пустые строки
-            if pd.isna(code) or pd.isna(name):
-                continue
-
-            # Преобразуем типы
-            code = int(code) if isinstance(code, (int, float)) else code
-            if isinstance(code, str):
-                code = int(code.strip())
-            name = str(name).strip()
-
-            # Создаем запись
-            entry = DictionaryEntry(
-                code=code,
-                name=name,
-                dictionary_type=dictionary_code
-            )
-            dictionary.add_entry(entry)
+        self._append_entries(
+            dictionary, filtered_df,
+            code_column=value_code_column,
+            name_column=value_name_column,
+            dictionary_type=dictionary_code
+        )
 
         self.logger.info(f"{Icon.SUCCESS} Справочник '{dictionary_code}' загружен: {len(dictionary)} записей")
 
         # Кэшируем
-        self._cache[cache_key] = dictionary
+        self._cache_put(self._cache, cache_key, dictionary)
 
         return dictionary
 
@@ -349,15 +368,17 @@ class DictionaryLoader:
         """
         self.logger.info(f"{Icon.DICTIONARY} Загрузка всех справочников из листа '{sheet_name}'")
 
-        # Загружаем Excel
-        df = load_excel(file_path, sheet_name=sheet_name, header=skip_rows)
-
-        # Проверяем колонки
-        required_cols = [dictionary_code_column, value_code_column, value_name_column]
-        self._validate_columns(df, required_cols)
+        # Загружаем лист и строим индекс групп (один проход по колонке)
+        _, group_index = self._get_grouped_sheet(
+            file_path, sheet_name,
+            dictionary_code_column=dictionary_code_column,
+            value_code_column=value_code_column,
+            value_name_column=value_name_column,
+            skip_rows=skip_rows
+        )
 
-        # Находим уникальные коды справочников
-        unique_codes = df[dictionary_code_column].dropna().unique()
+        # Уникальные коды справочников — ключи индекса групп
+        unique_codes = list(group_index)
 
         self.logger.info(f"{Icon.LIST} Найдено {len(unique_codes)} справочников: {list(unique_codes)[:5]}...")
 
@@ -398,12 +419,13 @@ class DictionaryLoader:
         Returns:
             Dictionary или None, если не найдено
         """
-        return self._cache.get(cache_key)
+        return self._cache_get(self._cache, cache_key)
 
     def clear_cache(self):
         """Очистить кэш справочников"""
         self.logger.info(f"{Icon.DELETE} Очистка кэша справочников")
         self._cache.clear()
+        self._group_index.clear()
 
     def get_cache_info(self) -> Dict[str, int]:
         """
@@ -414,9 +436,197 @@ class DictionaryLoader:
         """
         return {
             "cached_dictionaries": len(self._cache),
-            "cache_keys": list(self._cache.keys())
+            "cache_keys": list(self._cache.keys()),
+            "grouped_sheets": len(self._group_index),
+            "max_size": self.cache_size
         }
 
+    @staticmethod
+    def _file_cache_id(file_path: Path) -> str:
+        """
+        Построить идентификатор версии файла для ключей кэша
+
+        Полный путь + mtime (нс) + размер: разные файлы с одинаковым именем
+        не пересекаются, а изменённый файл не отдаётся из кэша устаревшим.
+
+        Args:
+            file_path: Путь к Excel файлу
+
+        Returns:
+            Строка "путь@mtime_ns:size" (или просто путь, если файл недоступен)
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return str(file_path)
+        return f"{file_path.resolve()}@{stat.st_mtime_ns}:{stat.st_size}"
+
+    @staticmethod
+    def _dictionary_cache_key(file_id: str, options: Tuple[Any, ...], name: str) -> str:
+        """
+        Построить ключ кэша справочника
+
+        В ключ входят все аргументы, влияющие на результат (лист, колонки,
+        skip_rows), как и в ключе индекса групп. Имя справочника стоит
+        последним: по суффиксу ":<имя>" справочник ищет ValueGenerator.
+
+        Args:
+            file_id: Идентификатор версии файла (_file_cache_id)
+            options: Аргументы загрузки, влияющие на результат
+            name: Имя справочника (лист или код справочника)
+
+        Returns:
+            Строка "file_id:options:name"
+        """
+        return f"{file_id}:{options!r}:{name}"
+
+    def _cache_get(self, cache: OrderedDict, key: Any) -> Any:
+        """
+        Получить значение из LRU-кэша (отмечает ключ как недавно использованный)
+
+        Args:
+            cache: Кэш (_cache или _group_index)
+            key: Ключ кэша
+
+        Returns:
+            Значение или None, если ключа нет
+        """
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key: Any, value: Any) -> None:
+        """
+        Положить значение в LRU-кэш, вытеснив самые старые при переполнении
+
+        Args:
+            cache: Кэш (_cache или _group_index)
+            key: Ключ кэша
+            value: Значение
+        """
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            evicted_key, _ = cache.popitem(last=False)
+            self.logger.debug(f"{Icon.DELETE} Вытеснен из кэша: {evicted_key}")
+
+    def _get_grouped_sheet(
+            self,
+            file_path: Path,
+            sheet_name: str,
+            dictionary_code_column: str,
+            value_code_column: str,
+            value_name_column: str,
+            skip_rows: int = 0,
+            file_id: Optional[str] = None
+    ) -> GroupedSheet:
+        """
+        Получить лист группового формата и индекс групп по коду справочника
+
+        Индекс ``{код_справочника: позиции строк}`` строится одним
+        groupby-проходом и кэшируется: K вызовов load_dictionary_by_code
+        по одному листу стоят O(N) + K·O(k) вместо K·O(N).
+
+        Args:
+            file_path: Путь к Excel файлу
+            sheet_name: Название листа
+            dictionary_code_column: Колонка с кодом справочника
+            value_code_column: Колонка с кодами значений
+            value_name_column: Колонка с названиями значений
+            skip_rows: Количество строк для пропуска
+            file_id: Готовый идентификатор файла (см. _file_cache_id),
+                чтобы не вызывать stat() повторно
+
+        Returns:
+            Кортеж (DataFrame листа, индекс групп)
+
+        Raises:
+            ValueError: Если обязательные колонки отсутствуют
+        """
+        required_cols = [dictionary_code_column, value_code_column, value_name_column]
+        if file_id is None:
+            file_id = self._file_cache_id(file_path)
+        index_key = (file_id, sheet_name, skip_rows, *required_cols)
+
+        cached = self._cache_get(self._group_index, index_key)
+        if cached is not None:
+            return cached
+
+        # Загружаем Excel (только нужные колонки, как строки без вывода типов)
+        df = load_excel(
+            file_path, sheet_name=sheet_name, header=skip_rows,
+            usecols=required_cols, dtype=STRING_DTYPE
+        )
+
+        # Проверяем наличие обязательных колонок
+        self._validate_columns(df, required_cols)
+
+        # Оставляем только нужные колонки: лист живёт в кэше,
+        # лишние колонки занимали бы память до вытеснения
+        df = df[required_cols]
+
+        group_index = df.groupby(dictionary_code_column, sort=False).indices
+        self._cache_put(self._group_index, index_key, (df, group_index))
+
+        return df, group_index
+
+    @staticmethod
+    def _append_entries(
+            dictionary: Dictionary,
+            df: pd.DataFrame,
+            code_column: str,
+            name_column: str,
+            dictionary_type: str,
+            description_column: Optional[str] = None
+    ) -> None:
+        """
+        Распарсить строки DataFrame и добавить записи в справочник
+
+        Приведение типов и strip выполняются векторно по колонкам (в C),
+        а не через str()/int() для каждой ячейки. Строки с пустым кодом
+        или названием пропускаются.
+
+        Args:
+            dictionary: Справочник для наполнения
+            df: DataFrame (целый лист или очередная порция)
+            code_column: Колонка с кодами
+            name_column: Колонка с названиями
+            dictionary_type: Тип справочника для записей
+            description_column: Колонка с описаниями (опционально)
+
+        Raises:
+            ValueError: Если код не является целым числом
+        """
+        # Пропускаем пустые строки
+        mask = df[code_column].notna() & df[name_column].notna()
+        if not mask.any():
+            return
+
+        # Преобразуем типы: код -> int, название/описание -> str без пробелов
+        raw_codes = df.loc[mask, code_column].astype("string").str.strip()
+        numeric_codes = pd.to_numeric(raw_codes, errors="coerce")
+        invalid = numeric_codes.isna() | (numeric_codes % 1 != 0)
+        if invalid.any():
+            bad_code = raw_codes[invalid.fillna(True)].iloc[0]
+            raise ValueError(f"Некорректный код справочника: {bad_code!r}")
+
+        codes = numeric_codes.astype("int64").tolist()
+        names = df.loc[mask, name_column].astype("string").str.strip().tolist()
+
+        if description_column and description_column in df.columns:
+            descriptions = (
+                df.loc[mask, description_column].astype("string").str.strip().fillna("").tolist()
+            )
+        else:
+            descriptions = [""] * len(codes)
+
+        # Одна интернированная строка типа на все записи (и все справочники)
+        dictionary_type = sys.intern(dictionary_type)
+
+        # Создаем записи и добавляем пачкой прямо из колонок
+        dictionary.extend_columns(codes, names, dictionary_type, descriptions)
+
     @staticmethod
     def _validate_columns(df: pd.DataFrame, required_columns: List[str]):
         """
@@ -429,9 +639,11 @@ class DictionaryLoader:
         Raises:
             ValueError: Если какая-то колонка отсутствует
         """
-        missing_columns = [col for col in required_columns if col not in df.columns]
+        missing = set(required_columns).difference(df.columns)
 
-        if missing_columns:
+        if missing:
+            # Сохраняем порядок required_columns в сообщении
+            missing_columns = [col for col in required_columns if col in missing]
             available = list(df.columns)
             raise ValueError(
                 f"Отсутствуют обязательные колонки: {missing_columns}. "
@@ -8,6 +8,7 @@
 }
 """
 import json
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -117,7 +118,9 @@ class JsonDictionaryLoader:
             if filter_current and not raw.get("currentVersion", True):
                 continue
 
-            dict_code = raw.get("dictionaryCode", "")
+            # json.load создаёт новую строку для каждого значения —
+            # интернируем, чтобы все записи справочника ссылались на одну
+            dict_code = sys.intern(raw.get("dictionaryCode", ""))
             entry = DictionaryEntry(
                 code=raw.get("canonicalCode", 0),
                 name=raw.get("name", ""),
@@ -143,8 +146,7 @@ class JsonDictionaryLoader:
                 dict_description = metadata[dict_code].name
 
             dictionary = Dictionary(name=dict_name, description=dict_description)
-            for entry in entries:
-                dictionary.add_entry(entry)
+            dictionary.extend(entries)
             dictionaries[dict_name] = dictionary
 
         return dictionaries
\ No newline at end of file
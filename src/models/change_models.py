@@ -11,6 +11,7 @@ from typing import List, Dict, Optional
 from datetime import datetime
 
 from src.models.schema_models import FieldChange
+from src.utils.json_utils import dumps_json_bytes
 from src.models.enums import (
     ChangeType,
     BreakingLevel,
@@ -308,6 +309,18 @@ class AnalysisResult:
             "metadata": self.metadata,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Сериализация в компактный JSON (UTF-8 байты)
+
+        Быстрый путь для выгрузки отчёта: через orjson, если установлен.
+        Структура совпадает с to_dict().
+
+        Returns:
+            JSON в виде байтов UTF-8
+        """
+        return dumps_json_bytes(self.to_dict())
+
     def has_critical_changes(self) -> bool:
         """Есть ли критические изменения"""
         return len(self.critical_changes) > 0
@@ -2,16 +2,77 @@
 Модели данных для JSON-сценариев
 """
 from dataclasses import dataclass, field as dataclass_field
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from pathlib import Path
 
+from src.utils.json_utils import dumps_json_bytes
+
+
+# Разобранный путь: (ключ, индекс массива или None) для каждого сегмента
+PathSegments = Tuple[Tuple[str, Optional[int]], ...]
+
+# Маркер отсутствующего значения (None может быть значением поля)
+_MISSING = object()
+
+
+@lru_cache(maxsize=4096)
+def _parse_path(path: str) -> PathSegments:
+    """
+    Разобрать путь к полю на сегменты (результат кэшируется)
+
+    Args:
+        path: Путь к полю (например, "loanRequest/items[0]/value")
+
+    Returns:
+        Кортеж пар (ключ, индекс), индекс равен None для обычных полей
+
+    Raises:
+        ValueError: Если индекс массива не является целым числом
+
+    Example:
+        >>> _parse_path("loanRequest/items[0]/value")
+        (('loanRequest', None), ('items', 0), ('value', None))
+    """
+    segments = []
+    for part in path.split("/"):
+        # Обработка массивов: "items[0]"
+        bracket = part.find("[")
+        if bracket != -1 and part.endswith("]"):
+            segments.append((part[:bracket], int(part[bracket + 1:-1])))
+        else:
+            segments.append((part, None))
+    return tuple(segments)
+
+
+def _step(current: Any, key: str, index: Optional[int]) -> Any:
+    """
+    Перейти на один сегмент пути без исключений
+
+    Args:
+        current: Текущий узел JSON
+        key: Ключ словаря
+        index: Индекс массива или None
+
+    Returns:
+        Следующий узел или _MISSING, если сегмент не существует
+    """
+    if not isinstance(current, dict):
+        return _MISSING
+    current = current.get(key, _MISSING)
+    if index is None or current is _MISSING:
+        return current
+    if not isinstance(current, (list, tuple)) or not -len(current) <= index < len(current):
+        return _MISSING
+    return current[index]
+
 
 # ============================================================================
 # DATACLASS: Метаданные сценария
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioMetadata:
     """
     Метаданные JSON-сценария
@@ -46,6 +107,13 @@ class ScenarioMetadata:
     source_file: Optional[Path] = None
     description: str = ""
     tags: List[str] = dataclass_field(default_factory=list)
+    # Кэш isoformat() для created_at/updated_at: (исходный datetime, строка)
+    _created_at_iso: Optional[Tuple[datetime, str]] = dataclass_field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _updated_at_iso: Optional[Tuple[datetime, str]] = dataclass_field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_tag(self, tag: str) -> None:
         """
@@ -77,16 +145,26 @@ class ScenarioMetadata:
         """
         Преобразовать метаданные в словарь
 
+        Строки дат берутся из кэша и пересчитываются, только если
+        created_at/updated_at заменили (например, в update_timestamp()).
+
         Returns:
             Словарь с метаданными
         """
+        created = self._created_at_iso
+        if created is None or created[0] is not self.created_at:
+            created = self._created_at_iso = (self.created_at, self.created_at.isoformat())
+        updated = self._updated_at_iso
+        if updated is None or updated[0] is not self.updated_at:
+            updated = self._updated_at_iso = (self.updated_at, self.updated_at.isoformat())
+
         return {
             "name": self.name,
             "version": self.version,
             "call": self.call,
             "adapter": self.adapter,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": created[1],
+            "updated_at": updated[1],
             "source_file": str(self.source_file) if self.source_file else None,
             "description": self.description,
             "tags": self.tags,
@@ -107,7 +185,7 @@ class ScenarioMetadata:
 # DATACLASS: JSON-сценарий
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Scenario:
     """
     JSON-сценарий для тестирования
@@ -150,17 +228,13 @@ class Scenario:
             >>> scenario.get_field_value("loanRequest/creditAmt")
             100000
         """
-        parts = path.split("/")
         current = self.data
 
-        for part in parts:
-            # Обработка массивов: "items[0]"
-            if "[" in part and "]" in part:
-                key, index_str = part.split("[")
-                index = int(index_str.rstrip("]"))
-                current = current[key][index]
+        for key, index in _parse_path(path):
+            if index is None:
+                current = current[key]
             else:
-                current = current[part]
+                current = current[key][index]
 
         return current
 
@@ -178,44 +252,42 @@ class Scenario:
             >>> scenario.data
             {'loanRequest': {'creditAmt': 100000}}
         """
-        parts = path.split("/")
+        segments = _parse_path(path)
         current = self.data
 
         # Проходим до предпоследнего элемента
-        for part in parts[:-1]:
-            if "[" in part and "]" in part:
-                key, index_str = part.split("[")
-                index = int(index_str.rstrip("]"))
-
+        for key, index in segments[:-1]:
+            if index is not None:
                 # Создаем массив, если его нет
                 if key not in current:
                     current[key] = []
 
-                # Расширяем массив при необходимости
-                while len(current[key]) <= index:
-                    current[key].append({})
+                # Расширяем массив при необходимости (новый dict на каждый элемент)
+                items = current[key]
+                gap = index + 1 - len(items)
+                if gap > 0:
+                    items.extend({} for _ in range(gap))
 
-                current = current[key][index]
+                current = items[index]
             else:
-                if part not in current:
-                    current[part] = {}
-                current = current[part]
+                if key not in current:
+                    current[key] = {}
+                current = current[key]
 
         # Устанавливаем значение
-        last_part = parts[-1]
-        if "[" in last_part and "]" in last_part:
-            key, index_str = last_part.split("[")
-            index = int(index_str.rstrip("]"))
-
+        key, index = segments[-1]
+        if index is not None:
             if key not in current:
                 current[key] = []
 
-            while len(current[key]) <= index:
-                current[key].append(None)
+            items = current[key]
+            gap = index + 1 - len(items)
+            if gap > 0:
+                items.extend([None] * gap)
 
-            current[key][index] = value
+            items[index] = value
         else:
-            current[last_part] = value
+            current[key] = value
 
         # Обновляем timestamp
         self.metadata.update_timestamp()
@@ -237,11 +309,15 @@ class Scenario:
             >>> scenario.has_field("loanRequest/nonExistentField")
             False
         """
-        try:
-            self.get_field_value(path)
-            return True
-        except (KeyError, IndexError, TypeError):
-            return False
+        current: Any = self.data
+
+        # Обход без исключений: has_field часто вызывается для отсутствующих полей
+        for key, index in _parse_path(path):
+            current = _step(current, key, index)
+            if current is _MISSING:
+                return False
+
+        return True
 
     def delete_field(self, path: str) -> bool:
         """
@@ -260,29 +336,26 @@ class Scenario:
             >>> scenario.has_field("loanRequest/creditAmt")
             False
         """
-        if not self.has_field(path):
+        segments = _parse_path(path)
+        current: Any = self.data
+
+        # Один проход до родителя последнего сегмента, без исключений
+        for key, index in segments[:-1]:
+            current = _step(current, key, index)
+            if current is _MISSING:
+                return False
+
+        # Удаляем последний элемент, если он существует
+        key, index = segments[-1]
+        if not isinstance(current, dict) or key not in current:
             return False
-
-        parts = path.split("/")
-        current = self.data
-
-        # Проходим до предпоследнего элемента
-        for part in parts[:-1]:
-            if "[" in part and "]" in part:
-                key, index_str = part.split("[")
-                index = int(index_str.rstrip("]"))
-                current = current[key][index]
-            else:
-                current = current[part]
-
-        # Удаляем последний элемент
-        last_part = parts[-1]
-        if "[" in last_part and "]" in last_part:
-            key, index_str = last_part.split("[")
-            index = int(index_str.rstrip("]"))
-            del current[key][index]
+        if index is None:
+            del current[key]
         else:
-            del current[last_part]
+            items = current[key]
+            if not isinstance(items, list) or not -len(items) <= index < len(items):
+                return False
+            del items[index]
 
         self.metadata.update_timestamp()
         return True
@@ -308,6 +381,15 @@ class Scenario:
             "data": self.data,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Преобразовать сценарий (метаданные + данные) в компактный JSON
+
+        Returns:
+            JSON в виде байтов UTF-8 (структура как в to_full_dict)
+        """
+        return dumps_json_bytes(self.to_full_dict())
+
     def __str__(self) -> str:
         return f"Scenario({self.metadata.name})"
 
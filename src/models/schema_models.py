@@ -3,10 +3,12 @@
 """
 # noinspection PyUnresolvedReferences
 from dataclasses import dataclass, field as dataclass_field
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Iterator
 from datetime import datetime
 from enum import Enum
+from itertools import chain
 import re
+import sys
 
 from src.utils.icons import Icon
 
@@ -31,11 +33,24 @@ class VersionStatus(Enum):
     DEPRECATED = "Выведено из эксплуатации"
 
 
+# Статусы, при которых версия считается выводимой из эксплуатации
+_DEPRECATED_STATUSES = frozenset({VersionStatus.DEPRECATING, VersionStatus.DEPRECATED})
+
+# Типы полей JSON Schema (FieldMetadata.is_primitive / is_complex)
+_PRIMITIVE_TYPES = frozenset({"string", "integer", "number", "boolean"})
+_COMPLEX_TYPES = frozenset({"object", "array"})
+
+# Уровни серьезности изменения (FieldChange.get_severity)
+_SEV_CRITICAL = "critical"
+_SEV_WARNING = "warning"
+_SEV_INFO = "info"
+
+
 # ============================================================================
 # DATACLASS: Информация о версии контракта
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class VersionInfo:
     """
     Информация о версии контракта
@@ -70,6 +85,15 @@ class VersionInfo:
     inclusion_date: Optional[str] = None
     comment: str = ""
     adapter: str = "front-adapter"
+    # Полная версия, собирается один раз в __post_init__
+    _full_version: str = dataclass_field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Собрать полную версию (version/subversion не меняются после создания)."""
+        if self.subversion:
+            self._full_version = f"{self.version}.{self.subversion}"
+        else:
+            self._full_version = self.version
 
     def full_version(self) -> str:
         """
@@ -78,9 +102,7 @@ class VersionInfo:
         Returns:
             Строка с полной версией
         """
-        if self.subversion:
-            return f"{self.version}.{self.subversion}"
-        return self.version
+        return self._full_version
 
     def is_current(self) -> bool:
         """Проверка, актуальна ли версия"""
@@ -92,10 +114,10 @@ class VersionInfo:
 
     def is_deprecated(self) -> bool:
         """Проверка, выводится ли версия из эксплуатации"""
-        return self.status in [VersionStatus.DEPRECATING, VersionStatus.DEPRECATED]
+        return self.status in _DEPRECATED_STATUSES
 
     def __str__(self) -> str:
-        return f"Version {self.full_version()} ({self.status.value})"
+        return f"Version {self._full_version} ({self.status.value})"
 
     def __repr__(self) -> str:
         return (
@@ -109,7 +131,7 @@ class VersionInfo:
 # DATACLASS: Условная обязательность поля (НОВЫЙ КЛАСС)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConditionalRequirement:
     """
     Условная обязательность поля (аналог ConditionalRequirement.java)
@@ -195,7 +217,7 @@ class ConditionalRequirement:
 # DATACLASS: Метаданные поля из JSON Schema
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class FieldMetadata:
     """
     Метаданные поля из JSON Schema
@@ -262,13 +284,26 @@ class FieldMetadata:
     conditional_dq_code: Optional[int] = None
     dictionary_dq_code: Optional[int] = None
 
+    def __post_init__(self) -> None:
+        """Интернировать тип поля и имя справочника: одна копия на все поля схемы"""
+        if type(self.field_type) is str:
+            self.field_type = sys.intern(self.field_type)
+        if type(self.dictionary) is str:
+            self.dictionary = sys.intern(self.dictionary)
+
     def is_primitive(self) -> bool:
         """Проверка, является ли поле примитивным типом"""
-        return self.field_type in ["string", "integer", "number", "boolean"]
+        try:
+            return self.field_type in _PRIMITIVE_TYPES
+        except TypeError:  # Нехешируемый тип, например ["string", "null"]
+            return False
 
     def is_complex(self) -> bool:
         """Проверка, является ли поле сложным типом"""
-        return self.field_type in ["object", "array"]
+        try:
+            return self.field_type in _COMPLEX_TYPES
+        except TypeError:  # Нехешируемый тип, например ["string", "null"]
+            return False
 
     def has_dictionary(self) -> bool:
         """Проверка, использует ли поле справочник"""
@@ -322,7 +357,7 @@ class FieldMetadata:
 # DATACLASS: Изменение поля между версиями
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class FieldChange:
     """
     Изменение поля между версиями
@@ -352,6 +387,10 @@ class FieldChange:
     old_meta: Optional[FieldMetadata] = None
     new_meta: Optional[FieldMetadata] = None
     changes: Dict[str, str] = dataclass_field(default_factory=dict)
+    # Результат is_breaking_change() (None — ещё не вычислен)
+    _breaking_cache: Optional[bool] = dataclass_field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def is_breaking_change(self) -> bool:
         """
@@ -362,6 +401,20 @@ class FieldChange:
         - Изменение типа поля
         - Поле стало обязательным (Н → О)
 
+        Результат вычисляется при первом вызове и кэшируется: FieldChange
+        создаётся компаратором уже заполненным и далее не изменяется.
+
+        Returns:
+            True, если изменение критичное
+        """
+        if self._breaking_cache is None:
+            self._breaking_cache = self._compute_breaking_change()
+        return self._breaking_cache
+
+    def _compute_breaking_change(self) -> bool:
+        """
+        Вычислить критичность изменения (без кэша)
+
         Returns:
             True, если изменение критичное
         """
@@ -370,11 +423,12 @@ class FieldChange:
             return True
 
         # Изменение типа поля
-        if "type" in self.changes:
+        changes = self.changes
+        if "type" in changes:
             return True
 
         # Поле стало обязательным
-        if "required" in self.changes and "Н → О" in self.changes["required"]:
+        if "Н → О" in changes.get("required", ""):
             return True
 
         return False
@@ -389,11 +443,10 @@ class FieldChange:
             "info" - информационное
         """
         if self.is_breaking_change():
-            return "critical"
-        elif self.change_type == "modified":
-            return "warning"
-        else:
-            return "info"
+            return _SEV_CRITICAL
+        if self.change_type == "modified":
+            return _SEV_WARNING
+        return _SEV_INFO
 
     def __str__(self) -> str:
         if self.change_type == "added":
@@ -412,7 +465,7 @@ class FieldChange:
 # DATACLASS: Разница между двумя схемами
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SchemaDiff:
     """
     Разница между двумя схемами
@@ -457,6 +510,15 @@ class SchemaDiff:
         """Проверка наличия изменений"""
         return self.total_changes() > 0
 
+    def iter_changes(self) -> Iterator[FieldChange]:
+        """
+        Итерировать все изменения без создания общего списка
+
+        Returns:
+            Итератор по added_fields, removed_fields и modified_fields (в этом порядке)
+        """
+        return chain(self.added_fields, self.removed_fields, self.modified_fields)
+
     def has_breaking_changes(self) -> bool:
         """
         Проверка наличия критичных изменений
@@ -464,27 +526,34 @@ class SchemaDiff:
         Returns:
             True, если есть хотя бы одно критичное изменение
         """
-        all_changes = self.added_fields + self.removed_fields + self.modified_fields
-        return any(change.is_breaking_change() for change in all_changes)
+        return any(change.is_breaking_change() for change in self.iter_changes())
 
     def get_breaking_changes(self) -> List[FieldChange]:
         """Получить список критичных изменений"""
-        all_changes = self.added_fields + self.removed_fields + self.modified_fields
-        return [change for change in all_changes if change.is_breaking_change()]
+        return [change for change in self.iter_changes() if change.is_breaking_change()]
+
+    def count_breaking_changes(self) -> int:
+        """Получить количество критичных изменений (без построения списка)"""
+        return sum(1 for change in self.iter_changes() if change.is_breaking_change())
 
     def get_statistics(self) -> Dict[str, int]:
         """
         Получить статистику изменений
 
+        Считается за один проход по изменениям без промежуточных списков.
+
         Returns:
             Словарь с количеством изменений по типам
         """
+        added = len(self.added_fields)
+        removed = len(self.removed_fields)
+        modified = len(self.modified_fields)
         return {
-            "added": len(self.added_fields),
-            "removed": len(self.removed_fields),
-            "modified": len(self.modified_fields),
-            "total": self.total_changes(),
-            "breaking": len(self.get_breaking_changes()),
+            "added": added,
+            "removed": removed,
+            "modified": modified,
+            "total": added + removed + modified,
+            "breaking": self.count_breaking_changes(),
         }
 
     def __str__(self) -> str:
@@ -8,7 +8,9 @@ Excel утилиты НЕ импортируются автоматически
 from .logger import log, log_function_call, LogBlock, get_logger
 
 # JSON утилиты
-from .json_utils import load_json, save_json, validate_json_schema, pretty_print_json
+from .json_utils import (
+    load_json, save_json, validate_json_schema, pretty_print_json, dumps_json_bytes
+)
 
 # Constraint utils
 from .constraint_utils import check_constraint
@@ -27,6 +29,7 @@ __all__ = [
     "save_json",
     "validate_json_schema",
     "pretty_print_json",
+    "dumps_json_bytes",
     # Constraint utils
     "check_constraint",
     # ASCII-иконки
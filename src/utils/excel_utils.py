@@ -1,11 +1,40 @@
 """
 Утилиты для работы с Excel
 """
+from functools import lru_cache
+import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from xml.etree import ElementTree
+import zipfile
+from typing import List, Dict, Any, Optional, Union, Callable, Iterable, Iterator, Tuple
+import numpy as np
 import pandas as pd
+from openpyxl import load_workbook
 from src.utils.logger import get_logger
 from src.utils.icons import Icon
+from src.utils.json_utils import dumps_json_bytes
+
+# Arrow-строки для текстовых колонок (опционально)
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Быстрое чтение xlsx на Rust (опционально): pandas engine="calamine"
+try:
+    from python_calamine import CalamineWorkbook, SheetTypeEnum
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# Движок pd.read_excel: calamine, если установлен, иначе выбор pandas (openpyxl)
+EXCEL_ENGINE: Optional[str] = "calamine" if CALAMINE_AVAILABLE else None
+
+# dtype для чтения колонок как строк: с pyarrow строки лежат в непрерывных
+# буферах Arrow (а .str-операции и сравнения выполняются в Arrow compute),
+# без него — обычные object-колонки с PyObject на каждую ячейку
+STRING_DTYPE: Any = "string[pyarrow]" if PYARROW_AVAILABLE else str
 
 logger = get_logger(__name__)
 
@@ -17,15 +46,25 @@ logger = get_logger(__name__)
 def load_excel(
     file_path: Path,
     sheet_name: Optional[str] = None,
-    header: int = 0
+    header: int = 0,
+    usecols: Optional[Union[Iterable[str], Callable[[str], bool]]] = None,
+    dtype: Optional[Any] = None
 ) -> pd.DataFrame:
     """
     Загрузить данные из Excel файла
 
+    Читается движком EXCEL_ENGINE: с python-calamine разбор xlsx идет в
+    нативном коде, без него — через openpyxl (по умолчанию pandas).
+
     Args:
         file_path: Путь к Excel файлу
         sheet_name: Название листа (если None, загружается первый лист)
         header: Строка с заголовками (по умолчанию 0)
+        usecols: Колонки для загрузки (список имён или предикат). Список
+            превращается в предикат, поэтому отсутствующие колонки не
+            вызывают ошибку pandas — их проверяет вызывающий код
+        dtype: Тип данных колонок (например, ``str`` или STRING_DTYPE —
+            без вывода типов)
 
     Returns:
         DataFrame с данными
@@ -45,7 +84,18 @@ def load_excel(
         sheet_info = f", лист: {sheet_name}" if sheet_name else ""
         logger.debug(f"{Icon.DIRECTORY} Загрузка Excel из {file_path.name}{sheet_info}")
 
-        df = pd.read_excel(file_path, sheet_name=sheet_name, header=header)
+        if usecols is not None and not callable(usecols):
+            wanted = frozenset(usecols)
+            usecols = wanted.__contains__
+
+        df = pd.read_excel(
+            file_path,
+            sheet_name=sheet_name,
+            header=header,
+            usecols=usecols,
+            dtype=dtype,
+            engine=EXCEL_ENGINE
+        )
 
         logger.info(f"{Icon.SUCCESS} Excel успешно загружен: {len(df)} строк")
         return df
@@ -54,6 +104,131 @@ def load_excel(
         raise
 
 
+def iter_excel_chunks(
+    file_path: Path,
+    sheet_name: Optional[str] = None,
+    header: int = 0,
+    chunksize: int = 10000,
+    usecols: Optional[Iterable[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Построчно читать лист Excel порциями (openpyxl read_only)
+
+    В отличие от load_excel, лист целиком в память не загружается:
+    пиковое потребление памяти — O(chunksize), а не O(число строк).
+    Первый чанк выдаётся всегда (пустой, если строк данных нет), чтобы
+    вызывающий код мог проверить колонки.
+
+    Args:
+        file_path: Путь к Excel файлу
+        sheet_name: Название листа (если None, читается первый лист)
+        header: Строка с заголовками (по умолчанию 0)
+        chunksize: Количество строк в одном чанке
+        usecols: Колонки для загрузки (None — все колонки)
+
+    Yields:
+        DataFrame с очередной порцией строк
+
+    Raises:
+        FileNotFoundError: Если файл не найден
+        ValueError: Если chunksize меньше 1
+
+    Example:
+        >>> for chunk in iter_excel_chunks(Path("data.xlsx"), "Sheet1", chunksize=5000):
+        ...     print(len(chunk))
+    """
+    if not file_path.exists():
+        logger.error(f"{Icon.ERROR} Файл не найден: {file_path}")
+        raise FileNotFoundError(f"Файл не найден: {file_path}")
+
+    if chunksize < 1:
+        raise ValueError(f"chunksize должен быть >= 1, получено: {chunksize}")
+
+    sheet_info = f", лист: {sheet_name}" if sheet_name else ""
+    logger.debug(f"{Icon.DIRECTORY} Потоковое чтение Excel из {file_path.name}{sheet_info}")
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        rows = worksheet.iter_rows(values_only=True)
+
+        for _ in range(header):
+            next(rows, None)
+        header_row = next(rows, None) or ()
+
+        columns = [
+            str(value) if value is not None else f"Unnamed: {i}"
+            for i, value in enumerate(header_row)
+        ]
+        wanted = frozenset(usecols) if usecols is not None else None
+        positions = [i for i, col in enumerate(columns) if wanted is None or col in wanted]
+        names = [columns[i] for i in positions]
+
+        batch: List[tuple] = []
+        total = 0
+        yielded = False
+        for row in rows:
+            width = len(row)
+            batch.append(tuple(row[i] if i < width else None for i in positions))
+            if len(batch) >= chunksize:
+                total += len(batch)
+                yield pd.DataFrame(batch, columns=names)
+                yielded = True
+                batch = []
+
+        if batch or not yielded:
+            total += len(batch)
+            yield pd.DataFrame(batch, columns=names)
+
+        logger.info(f"{Icon.SUCCESS} Excel прочитан потоково: {total} строк")
+    finally:
+        workbook.close()
+
+
+# Элементы xl/workbook.xml и xl/_rels/workbook.xml.rels (Transitional OOXML)
+_XLSX_SHEET_TAG = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}sheet"
+_XLSX_SHEET_REL_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+_XLSX_RELATIONSHIP_TAG = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+)
+_XLSX_WORKSHEET_REL_TYPE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"
+)
+
+
+def _read_xlsx_sheet_names(file_path: Path) -> Optional[List[str]]:
+    """
+    Прочитать названия листов из xl/workbook.xml, не разбирая сами листы
+
+    Как и pandas (openpyxl), возвращает только рабочие листы: листы
+    диаграмм отбрасываются по типу связи в xl/_rels/workbook.xml.rels.
+
+    Args:
+        file_path: Путь к xlsx/xlsm файлу
+
+    Returns:
+        Список названий листов или None, если файл не удалось разобрать
+        (не xlsx, например xls, или Strict OOXML) — тогда листы читает pandas
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            workbook_xml = archive.read("xl/workbook.xml")
+            rels_xml = archive.read("xl/_rels/workbook.xml.rels")
+    except (zipfile.BadZipFile, KeyError):
+        return None
+    sheets = list(ElementTree.fromstring(workbook_xml).iter(_XLSX_SHEET_TAG))
+    if not sheets:  # Другое пространство имен (Strict OOXML)
+        return None
+    rel_types = {
+        rel.get("Id"): rel.get("Type")
+        for rel in ElementTree.fromstring(rels_xml).iter(_XLSX_RELATIONSHIP_TAG)
+    }
+    return [
+        sheet.get("name") for sheet in sheets
+        if rel_types.get(sheet.get(_XLSX_SHEET_REL_ID)) == _XLSX_WORKSHEET_REL_TYPE
+    ]
+
+
 def get_sheet_names(file_path: Path) -> List[str]:
     """
     Получить список названий листов в Excel файле
@@ -74,8 +249,19 @@ def get_sheet_names(file_path: Path) -> List[str]:
         raise FileNotFoundError(f"Файл не найден: {file_path}")
 
     try:
-        excel_file = pd.ExcelFile(file_path)
-        sheet_names = excel_file.sheet_names
+        # Только список листов, без разбора их содержимого
+        if CALAMINE_AVAILABLE:
+            # Только рабочие листы, как pandas (без листов диаграмм)
+            sheet_names = [
+                sheet.name
+                for sheet in CalamineWorkbook.from_path(str(file_path)).sheets_metadata
+                if sheet.typ == SheetTypeEnum.WorkSheet
+            ]
+        else:
+            sheet_names = _read_xlsx_sheet_names(file_path)
+        if sheet_names is None:
+            with pd.ExcelFile(file_path) as excel_file:
+                sheet_names = excel_file.sheet_names
         logger.debug(f"{Icon.LIST} Листы в {file_path.name}: {sheet_names}")
         return sheet_names
     except Exception as e:
@@ -83,10 +269,67 @@ def get_sheet_names(file_path: Path) -> List[str]:
         raise
 
 
+@lru_cache(maxsize=32)
+def _read_sheet_cached(
+    resolved_path: str,
+    sheet_name: Optional[str],
+    mtime_ns: int,
+    size: int
+) -> pd.DataFrame:
+    """
+    Прочитать лист целиком (кэш по пути, листу, mtime и размеру файла)
+
+    mtime_ns и size входят в ключ, чтобы измененный файл читался заново.
+    DataFrame из кэша общий: вызывающий код не должен изменять его на месте.
+    """
+    return load_excel(Path(resolved_path), sheet_name=sheet_name)
+
+
+def _load_sheet(file_path: Path, sheet_name: Optional[str]) -> pd.DataFrame:
+    """
+    Загрузить лист для excel_to_dict / filter_excel_by_column / get_unique_values
+
+    Последовательные вызовы этих функций для одного и того же файла
+    разбирают книгу один раз.
+
+    Args:
+        file_path: Путь к Excel файлу
+        sheet_name: Название листа
+
+    Returns:
+        DataFrame листа (общий с кэшем, только для чтения)
+    """
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return load_excel(file_path, sheet_name=sheet_name)  # Ошибка с логом из load_excel
+    return _read_sheet_cached(
+        str(file_path.resolve()), sheet_name, stat.st_mtime_ns, stat.st_size
+    )
+
+
 # ============================================================================
 # ПРЕОБРАЗОВАНИЕ ДАННЫХ
 # ============================================================================
 
+def _sheet_values(df: pd.DataFrame) -> Tuple[List[Any], np.ndarray]:
+    """
+    Колонки и значения листа; пропуски (NaN/NaT/NA) заменены на None
+
+    Один object-массив на весь лист: None проставляется по маске на месте,
+    без промежуточного DataFrame из where().
+
+    Args:
+        df: DataFrame листа (не изменяется)
+
+    Returns:
+        (список колонок, 2D object-массив значений)
+    """
+    values = df.to_numpy(dtype=object)
+    values[pd.isna(values)] = None
+    return list(df.columns), values
+
+
 def excel_to_dict(
     file_path: Path,
     sheet_name: Optional[str] = None
@@ -106,12 +349,8 @@ def excel_to_dict(
         >>> print(data[0])
         {'column1': 'value1', 'column2': 'value2'}
     """
-    df = load_excel(file_path, sheet_name=sheet_name)
-
-    # Заменяем NaN на None
-    df = df.where(pd.notna(df), None)
-
-    records = df.to_dict(orient='records')
+    columns, values = _sheet_values(_load_sheet(file_path, sheet_name))
+    records = [dict(zip(columns, row)) for row in values.tolist()]
     logger.debug(f"{Icon.STAT} Преобразовано {len(records)} строк в словари")
 
     return records
@@ -126,6 +365,11 @@ def excel_to_json(
     """
     Преобразовать Excel в JSON файл
 
+    Строки пишутся в файл по одной, без промежуточного списка словарей
+    и без строки со всем JSON в памяти. Текст совпадает с
+    json.dump(excel_to_dict(...), indent=indent, ensure_ascii=False),
+    в том числе при indent=None (разделители ", " и ": ").
+
     Args:
         file_path: Путь к Excel файлу
         output_path: Путь к выходному JSON файлу
@@ -135,15 +379,32 @@ def excel_to_json(
     Example:
         >>> excel_to_json(Path("data.xlsx"), Path("output.json"))
     """
-    import json
-
-    data = excel_to_dict(file_path, sheet_name=sheet_name)
+    columns, values = _sheet_values(_load_sheet(file_path, sheet_name))
 
     # Создаем директорию, если её нет
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    # Каждая запись сдвигается на один уровень отступа внутри массива
+    # (переводов строк внутри строк JSON нет — они экранированы)
+    if indent is None:
+        separator, newline = b", ", b""
+    else:
+        newline = b"\n" + b" " * indent
+        separator = b"," + newline
+
+    with open(output_path, "wb") as f:
+        f.write(b"[")
+        for i, row in enumerate(values):
+            f.write(separator if i else newline)
+            record = dict(zip(columns, row.tolist()))
+            if indent is None:
+                # Разделители json.dump по умолчанию; dumps_json_bytes пишет без пробелов
+                f.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+            else:
+                f.write(dumps_json_bytes(record, indent=indent).replace(b"\n", newline))
+        if len(values) and indent is not None:
+            f.write(b"\n")
+        f.write(b"]")
 
     logger.info(f"{Icon.SUCCESS} Excel преобразован в JSON: {output_path.name}")
 
@@ -173,7 +434,7 @@ def filter_excel_by_column(
     Example:
         >>> df = filter_excel_by_column(Path("data.xlsx"), "Status", "Active")
     """
-    df = load_excel(file_path, sheet_name=sheet_name)
+    df = _load_sheet(file_path, sheet_name)
 
     if column_name not in df.columns:
         logger.error(f"{Icon.ERROR} Колонка '{column_name}' не найдена в файле")
@@ -204,7 +465,7 @@ def get_unique_values(
     Example:
         >>> values = get_unique_values(Path("data.xlsx"), "Category")
     """
-    df = load_excel(file_path, sheet_name=sheet_name)
+    df = _load_sheet(file_path, sheet_name)
 
     if column_name not in df.columns:
         logger.error(f"{Icon.ERROR} Колонка '{column_name}' не найдена в файле")
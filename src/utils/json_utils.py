@@ -2,18 +2,28 @@
 Утилиты для работы с JSON
 """
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, FrozenSet, Optional, List
 from src.utils.logger import get_logger
 from src.utils.icons import Icon
 
 # Импорты для валидации JSON Schema
 try:
-    from jsonschema import validate, ValidationError, Draft201909Validator
+    from jsonschema import ValidationError, Draft201909Validator
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
     JSONSCHEMA_AVAILABLE = True
 except ImportError:
     JSONSCHEMA_AVAILABLE = False
 
+# Быстрая сериализация (опционально)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
 
@@ -21,6 +31,57 @@ logger = get_logger(__name__)
 # ЗАГРУЗКА И СОХРАНЕНИЕ JSON
 # ============================================================================
 
+def _loads_json_bytes(raw: bytes) -> Any:
+    """
+    Разобрать JSON из байтов UTF-8
+
+    Использует orjson, если он установлен. orjson строже stdlib json
+    (NaN/Infinity, целые больше 64 бит), поэтому при его ошибке разбор
+    повторяется через json.loads: невалидный JSON по-прежнему приводит
+    к json.JSONDecodeError.
+
+    Args:
+        raw: Содержимое JSON файла
+
+    Returns:
+        Разобранные данные
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
+def _dumps_orjson(data: Any, indent: Optional[int] = None) -> Optional[bytes]:
+    """
+    Сериализовать данные через orjson (тот же текст, что json.dumps без ensure_ascii)
+
+    orjson поддерживает только отступ 2 и не умеет целые больше 64 бит;
+    в этих случаях (и без orjson) возвращается None, и вызывающий код
+    использует json.dumps. Отличия от stdlib: NaN/Infinity записываются
+    как null (stdlib пишет невалидные для JSON NaN/Infinity), экспонента
+    float без знака "+" (1e20 вместо 1e+20).
+
+    Args:
+        data: Данные для сериализации
+        indent: None (компактно) или 2
+
+    Returns:
+        JSON в виде байтов UTF-8 или None
+    """
+    if not ORJSON_AVAILABLE or indent not in (None, 2):
+        return None
+    option = orjson.OPT_NON_STR_KEYS
+    if indent == 2:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(data, option=option)
+    except orjson.JSONEncodeError:
+        return None
+
+
 def load_json(file_path: Path) -> Dict[str, Any]:
     """
     Загрузить JSON из файла
@@ -45,8 +106,7 @@ def load_json(file_path: Path) -> Dict[str, Any]:
 
     try:
         logger.debug(f"{Icon.DIRECTORY} Загрузка JSON из {file_path}")
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _loads_json_bytes(file_path.read_bytes())
         logger.info(f"{Icon.SUCCESS} JSON успешно загружен из {file_path.name}")
         return data
     except json.JSONDecodeError as e:
@@ -82,8 +142,12 @@ def save_json(
         # Создаем директорию, если её нет
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+        raw = None if ensure_ascii else _dumps_orjson(data, indent)
+        if raw is not None:
+            file_path.write_bytes(raw)
+        else:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
 
         logger.info(f"{Icon.SUCCESS} JSON успешно сохранен в {file_path.name}")
     except Exception as e:
@@ -95,6 +159,33 @@ def save_json(
 # ВАЛИДАЦИЯ JSON SCHEMA
 # ============================================================================
 
+@lru_cache(maxsize=64)
+def _get_validator(schema_key: bytes, strict: bool) -> Any:
+    """
+    Построить валидатор для схемы (результат кэшируется)
+
+    Ключ — сериализованная схема: валидатор строится по ее копии, поэтому
+    изменение исходного dict схемы после вызова не влияет на кэш.
+
+    Args:
+        schema_key: Схема, сериализованная dumps_json_bytes
+        strict: True — как jsonschema.validate (класс по $schema и
+            check_schema), False — Draft201909Validator без проверки схемы
+
+    Returns:
+        Валидатор jsonschema
+
+    Raises:
+        SchemaError: Если strict=True и схема невалидна (не кэшируется)
+    """
+    schema = _loads_json_bytes(schema_key)
+    if not strict:
+        return Draft201909Validator(schema)
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
 def validate_json_schema(
     data: Dict[str, Any],
     schema: Dict[str, Any]
@@ -124,7 +215,11 @@ def validate_json_schema(
         raise ImportError("Установите jsonschema: pip install jsonschema")
 
     try:
-        validate(instance=data, schema=schema)
+        # То же, что jsonschema.validate, но схема проверяется один раз
+        validator = _get_validator(dumps_json_bytes(schema), True)
+        error = best_match(validator.iter_errors(data))
+        if error is not None:
+            raise error
         logger.debug(f"{Icon.SUCCESS} JSON валидация успешна")
         return True
     except ValidationError as e:
@@ -160,7 +255,7 @@ def get_validation_errors(
         logger.error(f"{Icon.ERROR} Библиотека jsonschema не установлена")
         raise ImportError("Установите jsonschema: pip install jsonschema")
 
-    validator = Draft201909Validator(schema)
+    validator = _get_validator(dumps_json_bytes(schema), False)
     errors = list(validator.iter_errors(data))
 
     if errors:
@@ -192,6 +287,9 @@ def pretty_print_json(data: Dict[str, Any], indent: int = 2) -> str:
         >>> data = {"key": "value", "nested": {"a": 1}}
         >>> print(pretty_print_json(data))
     """
+    raw = _dumps_orjson(data, indent)
+    if raw is not None:
+        return raw.decode("utf-8")
     return json.dumps(data, indent=indent, ensure_ascii=False)
 
 
@@ -210,9 +308,39 @@ def minify_json(data: Dict[str, Any]) -> str:
         >>> minify_json(data)
         '{"key":"value"}'
     """
+    raw = _dumps_orjson(data)
+    if raw is not None:
+        return raw.decode("utf-8")
     return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
 
 
+def dumps_json_bytes(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Сериализовать данные в JSON (UTF-8 байты)
+
+    Использует orjson, если он установлен (в разы быстрее stdlib json),
+    иначе — json.dumps. Без indent результат эквивалентен
+    minify_json(data).encode(), с indent — pretty_print_json(data, indent).encode().
+
+    Args:
+        data: Данные для сериализации
+        indent: Отступ (None — компактный JSON без пробелов)
+
+    Returns:
+        JSON в виде байтов UTF-8
+
+    Example:
+        >>> dumps_json_bytes({"key": "value"})
+        b'{"key":"value"}'
+    """
+    raw = _dumps_orjson(data, indent)
+    if raw is not None:
+        return raw
+    if indent is None:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
 # ============================================================================
 # РАБОТА СО СХЕМАМИ
 # ============================================================================
@@ -235,11 +363,24 @@ def merge_schemas(base_schema: Dict[str, Any], override_schema: Dict[str, Any])
     """
     result = base_schema.copy()
 
-    for key, value in override_schema.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_schemas(result[key], value)
-        else:
-            result[key] = value
+    # Обход через явный стек пар (копия узла base, узел override) вместо рекурсии:
+    # копируются только словари на путях, которых касается override, остальные
+    # поддеревья base разделяются с результатом (как и раньше).
+    # Схемы из JSON состоят из обычных dict, поэтому сравнение type() вместо
+    # isinstance(): для листовых значений проверка обходится заметно дешевле
+    stack = [(result, override_schema)]
+    while stack:
+        target, override = stack.pop()
+        for key, value in override.items():
+            current = target.get(key)
+            if type(current) is dict and type(value) is dict:
+                # Пустой override не меняет поддерево base: оно остается общим
+                if value:
+                    merged = current.copy()
+                    target[key] = merged
+                    stack.append((merged, value))
+            else:
+                target[key] = value
 
     return result
 
@@ -253,7 +394,8 @@ def extract_required_fields(schema: Dict[str, Any], prefix: str = "") -> List[st
         prefix: Префикс пути (для рекурсии)
 
     Returns:
-        Список путей к обязательным полям
+        Список путей к обязательным полям (поля объектов в элементах массивов —
+        с путем вида ``pledges[]/pledgeType``)
 
     Example:
         >>> schema = {
@@ -265,19 +407,48 @@ def extract_required_fields(schema: Dict[str, Any], prefix: str = "") -> List[st
         ['name']
     """
     required_fields: List[str] = []
+    _collect_required_fields(schema, prefix, required_fields)
+    return required_fields
+
+
+def _collect_required_fields(schema: Dict[str, Any], prefix: str, out: List[str]) -> None:
+    """
+    Дописать в out пути обязательных полей схемы и ее вложенных объектов
+
+    Общий список передается вниз по рекурсии, поэтому вложенные уровни
+    не создают промежуточных списков.
+    """
+    sep = "/" if prefix else ""
 
     # Получаем обязательные поля на текущем уровне
-    required = schema.get("required", [])
-    for field_name in required:
-        field_path = f"{prefix}/{field_name}" if prefix else field_name
-        required_fields.append(field_path)
-
-    # Рекурсивно обрабатываем вложенные объекты
-    properties = schema.get("properties", {})
-    for field_name, field_schema in properties.items():
-        if field_schema.get("type") == "object":
-            field_path = f"{prefix}/{field_name}" if prefix else field_name
-            nested_required = extract_required_fields(field_schema, prefix=field_path)
-            required_fields.extend(nested_required)
+    for field_name in schema.get("required", []):
+        out.append(f"{prefix}{sep}{field_name}")
+
+    # Рекурсивно обрабатываем вложенные объекты и объекты в элементах массивов
+    # (путь элемента массива — "<поле>[]", как в SchemaParser)
+    for field_name, field_schema in schema.get("properties", {}).items():
+        field_type = field_schema.get("type")
+        if field_type == "object":
+            _collect_required_fields(field_schema, f"{prefix}{sep}{field_name}", out)
+        elif field_type == "array":
+            items = field_schema.get("items")
+            if isinstance(items, dict) and items.get("type") == "object":
+                _collect_required_fields(items, f"{prefix}{sep}{field_name}[]", out)
+
+
+def extract_required_fields_set(schema: Dict[str, Any], prefix: str = "") -> FrozenSet[str]:
+    """
+    Извлечь множество путей обязательных полей (для проверок ``path in required``)
 
-    return required_fields
+    Args:
+        schema: JSON Schema
+        prefix: Префикс пути
+
+    Returns:
+        Неизменяемое множество путей к обязательным полям
+
+    Example:
+        >>> "name" in extract_required_fields_set({"required": ["name"]})
+        True
+    """
+    return frozenset(extract_required_fields(schema, prefix))
@@ -1,13 +1,65 @@
 """
 Модуль логирования с использованием loguru
 """
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import wraps
 from loguru import logger
+import os
 import sys
+import zipfile
 from pathlib import Path
 from config.settings import config
 from src.utils.icons import Icon
 
 
+# Сжатие ротированных логов выполняется в отдельном потоке: встроенное
+# compression="zip" loguru сжимает файл под блокировкой handler'а, и все
+# записи в лог ждут окончания сжатия. Поток исполнителя создается при первой
+# ротации, а при выходе интерпретатор дожидается незавершенных задач
+_compression_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+
+
+def _zip_log_file(path: str) -> None:
+    """Сжать файл лога в ``<path>.zip`` и удалить исходный файл"""
+    with zipfile.ZipFile(f"{path}.zip", "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.write(path, arcname=os.path.basename(path))
+    os.remove(path)
+
+
+def _report_compression_error(path: str, future: Future) -> None:
+    """Вывести в stderr ошибку сжатия: исключение в потоке исполнителя иначе теряется"""
+    error = future.exception()
+    if error is not None:
+        print(f"{Icon.ERROR} Не удалось сжать лог {path}: {error!r}", file=sys.stderr)
+
+
+def _compress_in_background(path: str) -> Future:
+    """
+    Поставить ротированный файл лога в очередь на сжатие (compression для loguru)
+
+    Если исполнитель уже не принимает задачи (ротация при завершении
+    интерпретатора), файл сжимается синхронно. Ошибки сжатия выводятся в stderr.
+
+    Args:
+        path: Путь к ротированному файлу лога
+
+    Returns:
+        Future задачи сжатия (при синхронном сжатии - уже завершенный)
+    """
+    try:
+        future = _compression_executor.submit(_zip_log_file, path)
+    except RuntimeError:  # cannot schedule new futures after interpreter shutdown
+        future = Future()
+        try:
+            _zip_log_file(path)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(None)
+    future.add_done_callback(lambda done: _report_compression_error(path, done))
+    return future
+
+
 def setup_logger():
     """
     Настройка логгера с использованием loguru
@@ -37,8 +89,8 @@ def setup_logger():
         format=config.LOG_FORMAT,
         level=config.LOG_LEVEL,
         colorize=True,
-        backtrace=True,  # Показывать полный traceback при ошибках
-        diagnose=True,  # Показывать значения переменных при ошибках
+        backtrace=config.LOG_BACKTRACE,  # Показывать полный traceback при ошибках
+        diagnose=config.LOG_DIAGNOSE,  # Показывать значения переменных при ошибках
     )
 
     # ======================================
@@ -51,9 +103,9 @@ def setup_logger():
         level=config.LOG_LEVEL,
         rotation=config.LOG_ROTATION,  # Ротация при достижении размера
         retention=config.LOG_RETENTION,  # Хранить логи N дней
-        compression="zip",  # Сжимать старые логи
-        backtrace=True,
-        diagnose=True,
+        compression=_compress_in_background,  # Сжимать старые логи (в фоне)
+        backtrace=config.LOG_BACKTRACE,
+        diagnose=False,  # Значения переменных не пишутся на диск
     )
 
     # Логируем успешную инициализацию
@@ -114,16 +166,19 @@ def log_function_call(func):
         def my_function(arg1, arg2):
             return arg1 + arg2
     """
-    from functools import wraps
+    func_name = func.__name__
+    # Шаблоны для lazy=True: loguru вызывает аргументы-функции (и строит repr
+    # аргументов и результата), только если уровень DEBUG включен
+    call_message = f"{Icon.CONFIG} Вызов функции: {func_name}() с args={{}}, kwargs={{}}"
+    result_message = f"{Icon.SUCCESS} Функция {func_name}() завершена. Результат: {{}}"
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        func_name = func.__name__
-        log.debug(f"{Icon.CONFIG} Вызов функции: {func_name}() с args={args}, kwargs={kwargs}")
+        log.opt(lazy=True).debug(call_message, lambda: args, lambda: kwargs)
 
         try:
             result = func(*args, **kwargs)
-            log.debug(f"{Icon.SUCCESS} Функция {func_name}() завершена. Результат: {result}")
+            log.opt(lazy=True).debug(result_message, lambda: result)
             return result
         except Exception as e:
             log.error(f"{Icon.ERROR} Ошибка в функции {func_name}(): {e}")
@@ -249,25 +249,25 @@ def scenario_with_arrays():
 # ФИКСТУРЫ: Тестовые файлы
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """Фикстура для директории с тестовыми данными"""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_schemas_dir(fixtures_dir):
     """Фикстура для директории с тестовыми схемами"""
     return fixtures_dir / "schemas"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_dictionaries_dir(fixtures_dir):
     """Фикстура для директории с тестовыми справочниками"""
     return fixtures_dir / "dictionaries"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_scenarios_dir(fixtures_dir):
     """Фикстура для директории с тестовыми сценариями"""
     return fixtures_dir / "scenarios"
@@ -8,13 +8,15 @@ from src.core.condition_evaluator import ConditionEvaluator, EvaluationContext
 from src.core.spel_parser import SpelParser
 
 
-@pytest.fixture
+# Парсер и вычислитель не хранят состояния между вызовами, а построение
+# грамматики дорогое, поэтому создаются один раз на модуль
+@pytest.fixture(scope="module")
 def evaluator():
     """Создать ConditionEvaluator"""
     return ConditionEvaluator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser():
     """Создать SpelParser"""
     return SpelParser()
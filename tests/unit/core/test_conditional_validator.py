@@ -27,9 +27,9 @@ from src.core.condition_evaluator import ConditionEvaluator
 # Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def evaluator():
-    """Создать ConditionEvaluator"""
+    """Создать ConditionEvaluator (без состояния, один на модуль)"""
     return ConditionEvaluator()
 
 
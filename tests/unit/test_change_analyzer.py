@@ -809,6 +809,23 @@ def test_analysis_result_to_dict():
     assert len(result_dict["changes"]) == 1
 
 
+def test_analysis_result_to_json_bytes():
+    """Тест: JSON-байты совпадают по структуре с to_dict()"""
+    import json
+
+    result = AnalysisResult(
+        old_version="V072",
+        new_version="V073",
+        analyzed_changes=[],
+        metadata={"автор": "qa"}
+    )
+
+    payload = result.to_json_bytes()
+
+    assert isinstance(payload, bytes)
+    assert json.loads(payload) == result.to_dict()
+
+
 # ============================================================================
 # НОВЫЕ ТЕСТЫ: Enum методы
 # ============================================================================
@@ -43,3 +43,9 @@ def test_get_updated_scenario_path():
     original = Path("data/scenarios/call1_v070.json")
     updated = config.get_updated_scenario_path(original, "072")
     assert updated == config.UPDATED_SCENARIOS_DIR / "call1_v070_updated_to_v072.json"
+
+
+def test_exception_diagnostics_off_by_default():
+    """Тест: расширенная диагностика исключений выключена по умолчанию"""
+    assert AppConfig.LOG_BACKTRACE is False
+    assert AppConfig.LOG_DIAGNOSE is False
@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import patch
 import pandas as pd
 from src.loaders.dictionary_loader import DictionaryLoader
+from src.utils.excel_utils import STRING_DTYPE
 from src.models.dictionary_models import Dictionary
 
 
@@ -104,6 +105,39 @@ def test_load_dictionary_skip_empty_rows(mock_load_excel, loader):
     assert dictionary.get_by_code(1).name == "Первый"
 
 
+@patch('src.loaders.dictionary_loader.load_excel')
+def test_load_dictionary_normalizes_codes_and_names(mock_load_excel, loader):
+    """Тест: коды приводятся к int, названия очищаются от пробелов"""
+    mock_load_excel.return_value = pd.DataFrame({
+        "Код": [" 10410001 ", 2.0, 3],
+        "Значение": [" PACL ", "TOPUP", "X"]
+    })
+
+    dictionary = loader.load_dictionary(
+        file_path=Path("test.xlsx"),
+        sheet_name="TestSheet"
+    )
+
+    assert dictionary.get_all_codes() == (10410001, 2, 3)
+    assert all(type(code) is int for code in dictionary.get_all_codes())
+    assert dictionary.get_by_code(10410001).name == "PACL"
+
+
+@patch('src.loaders.dictionary_loader.load_excel')
+def test_load_dictionary_invalid_code(mock_load_excel, loader):
+    """Тест: нечисловой код вызывает ValueError"""
+    mock_load_excel.return_value = pd.DataFrame({
+        "Код": ["01", "abc"],
+        "Значение": ["Первый", "Второй"]
+    })
+
+    with pytest.raises(ValueError, match="Некорректный код справочника: 'abc'"):
+        loader.load_dictionary(
+            file_path=Path("test.xlsx"),
+            sheet_name="TestSheet"
+        )
+
+
 @patch('src.loaders.dictionary_loader.load_excel')
 def test_load_dictionary_caching(mock_load_excel, loader, sample_dataframe_classic):
     """Тест: кэширование загруженных справочников"""
@@ -126,6 +160,44 @@ def test_load_dictionary_caching(mock_load_excel, loader, sample_dataframe_class
     assert dict1 is dict2  # Это один и тот же объект из кэша
 
 
+@patch('src.loaders.dictionary_loader.load_excel')
+def test_load_dictionary_cache_key_includes_arguments(mock_load_excel, loader):
+    """Тест: вызовы с другими колонками или skip_rows не берут чужой результат из кэша"""
+    df = pd.DataFrame({"code": ["1"], "name": ["a"], "alt": ["x"]})
+    shifted_df = pd.DataFrame({"code": ["2"], "name": ["b"], "alt": ["y"]})
+    mock_load_excel.side_effect = [df, df, shifted_df]
+    path = Path("test.xlsx")
+
+    by_name = loader.load_dictionary(path, "S", code_column="code", name_column="name")
+    by_alt = loader.load_dictionary(path, "S", code_column="code", name_column="alt")
+    shifted = loader.load_dictionary(
+        path, "S", code_column="code", name_column="name", skip_rows=1
+    )
+
+    assert by_name.get_all_names() == ("a",)
+    assert by_alt.get_all_names() == ("x",)
+    assert shifted.get_all_codes() == (2,)
+    assert mock_load_excel.call_count == 3
+    # Повторный вызов с теми же аргументами — из кэша
+    assert loader.load_dictionary(path, "S", code_column="code", name_column="alt") is by_alt
+
+
+@patch('src.loaders.dictionary_loader.load_excel')
+def test_load_dictionary_reads_only_needed_columns(mock_load_excel, loader, sample_dataframe_classic):
+    """Тест: в load_excel передаются только нужные колонки и dtype=str"""
+    mock_load_excel.return_value = sample_dataframe_classic
+
+    loader.load_dictionary(
+        file_path=Path("test.xlsx"),
+        sheet_name="TestSheet",
+        description_column="Описание"
+    )
+
+    kwargs = mock_load_excel.call_args.kwargs
+    assert kwargs["usecols"] == ["Код", "Значение", "Описание"]
+    assert kwargs["dtype"] is STRING_DTYPE
+
+
 @patch('src.loaders.dictionary_loader.load_excel')
 def test_load_dictionary_missing_columns(mock_load_excel, loader):
     """Тест: ошибка при отсутствии обязательных колонок"""
@@ -141,6 +213,86 @@ def test_load_dictionary_missing_columns(mock_load_excel, loader):
         )
 
 
+@pytest.fixture
+def classic_xlsx(tmp_path):
+    """Реальный Excel файл в классическом формате (5 строк, одна пустая)"""
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "STATUS"
+    sheet.append(["Код", "Значение", "Лишняя"])
+    sheet.append([1, "Первый", "x"])
+    sheet.append([2, " Второй ", "x"])
+    sheet.append([None, "Без кода", "x"])
+    sheet.append(["04", "Четвёртый", "x"])
+    sheet.append([5.0, "Пятый", "x"])
+    file_path = tmp_path / "classic.xlsx"
+    workbook.save(file_path)
+    return file_path
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 2, 100])
+def test_load_dictionary_chunked_matches_full_read(loader, classic_xlsx, chunksize):
+    """Тест: потоковое чтение порциями даёт тот же результат, что и полное"""
+    dictionary = loader.load_dictionary(
+        file_path=classic_xlsx,
+        sheet_name="STATUS",
+        chunksize=chunksize
+    )
+
+    assert dictionary.get_all_codes() == (1, 2, 4, 5)
+    assert dictionary.get_by_code(2).name == "Второй"
+
+
+def test_load_dictionary_cache_invalidated_by_file_change(loader, classic_xlsx):
+    """Тест: изменённый файл перечитывается, а не отдаётся из кэша"""
+    import os
+    from openpyxl import Workbook
+
+    first = loader.load_dictionary(file_path=classic_xlsx, sheet_name="STATUS")
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "STATUS"
+    sheet.append(["Код", "Значение"])
+    sheet.append([7, "Новый"])
+    workbook.save(classic_xlsx)
+    stat = classic_xlsx.stat()
+    os.utime(classic_xlsx, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = loader.load_dictionary(file_path=classic_xlsx, sheet_name="STATUS")
+
+    assert second is not first
+    assert second.get_all_codes() == (7,)
+
+
+def test_load_dictionary_same_name_different_dirs(loader, classic_xlsx, tmp_path):
+    """Тест: одноимённые файлы в разных папках не пересекаются в кэше"""
+    import shutil
+
+    other = tmp_path / "other" / classic_xlsx.name
+    other.parent.mkdir()
+    shutil.copy(classic_xlsx, other)
+
+    first = loader.load_dictionary(file_path=classic_xlsx, sheet_name="STATUS")
+    second = loader.load_dictionary(file_path=other, sheet_name="STATUS")
+
+    assert second is not first
+    assert loader.get_cache_info()["cached_dictionaries"] == 2
+
+
+def test_load_dictionary_chunked_missing_columns(loader, classic_xlsx):
+    """Тест: при потоковом чтении отсутствие колонок тоже даёт ValueError"""
+    with pytest.raises(ValueError, match="Отсутствуют обязательные колонки"):
+        loader.load_dictionary(
+            file_path=classic_xlsx,
+            sheet_name="STATUS",
+            name_column="Нет такой",
+            chunksize=2
+        )
+
+
 # ============================================================================
 # ТЕСТЫ: Групповой формат (load_dictionary_by_code)
 # ============================================================================
@@ -202,6 +354,28 @@ def test_load_dictionary_by_code_caching(mock_load_excel, loader, sample_datafra
 # ТЕСТЫ: Загрузка всех справочников
 # ============================================================================
 
+@patch('src.loaders.dictionary_loader.load_excel')
+def test_load_dictionary_by_code_cache_key_includes_arguments(mock_load_excel, loader):
+    """Тест: групповой формат — другие колонки и skip_rows дают отдельные записи кэша"""
+    mock_load_excel.return_value = pd.DataFrame({
+        "Код справочника": ["STATUS"],
+        "Код РКК": ["1"],
+        "Наименование значения": ["Активный"],
+        "Краткое наименование": ["А"],
+    })
+    path = Path("test.xlsx")
+
+    full = loader.load_dictionary_by_code(path, "All", "STATUS")
+    short = loader.load_dictionary_by_code(
+        path, "All", "STATUS", value_name_column="Краткое наименование"
+    )
+    loader.load_dictionary_by_code(path, "All", "STATUS", skip_rows=1)
+
+    assert full.get_all_names() == ("Активный",)
+    assert short.get_all_names() == ("А",)
+    assert loader.get_cache_info()["cached_dictionaries"] == 3
+
+
 @patch('src.loaders.dictionary_loader.load_excel')
 def test_load_all_dictionaries_from_sheet(mock_load_excel, loader, sample_dataframe_grouped):
     """Тест: загрузка всех справочников из одного листа"""
@@ -219,6 +393,41 @@ def test_load_all_dictionaries_from_sheet(mock_load_excel, loader, sample_datafr
     assert len(dictionaries["TYPE"]) == 2
 
 
+@patch('src.loaders.dictionary_loader.load_excel')
+def test_load_all_dictionaries_from_sheet_reads_excel_once(mock_load_excel, loader, sample_dataframe_grouped):
+    """Тест: лист группового формата читается один раз на все коды справочников"""
+    mock_load_excel.return_value = sample_dataframe_grouped
+
+    loader.load_all_dictionaries_from_sheet(
+        file_path=Path("test.xlsx"),
+        sheet_name="All"
+    )
+    loader.load_dictionary_by_code(
+        file_path=Path("test.xlsx"),
+        sheet_name="All",
+        dictionary_code="NONEXISTENT"
+    )
+
+    assert mock_load_excel.call_count == 1
+    assert loader.get_cache_info()["grouped_sheets"] == 1
+
+
+@patch('src.loaders.dictionary_loader.load_excel')
+def test_grouped_sheet_keeps_only_required_columns(mock_load_excel, loader, sample_dataframe_grouped):
+    """Тест: в кэше группового листа хранятся только используемые колонки"""
+    wide_df = sample_dataframe_grouped.assign(Комментарий="x", Дата="2026-01-01")
+    mock_load_excel.return_value = wide_df
+
+    loader.load_dictionary_by_code(
+        file_path=Path("test.xlsx"),
+        sheet_name="All",
+        dictionary_code="STATUS"
+    )
+
+    (cached_df, _), = loader._group_index.values()
+    assert list(cached_df.columns) == ["Код справочника", "Код РКК", "Наименование значения"]
+
+
 @patch('src.loaders.dictionary_loader.get_sheet_names')
 @patch('src.loaders.dictionary_loader.load_excel')
 def test_load_all_dictionaries_classic(mock_load_excel, mock_get_sheets, loader, sample_dataframe_classic):
@@ -282,6 +491,27 @@ def test_clear_cache(loader):
     assert len(loader._cache) == 0
 
 
+@patch('src.loaders.dictionary_loader.load_excel')
+def test_cache_is_bounded_lru(mock_load_excel, sample_dataframe_classic):
+    """Тест: кэш ограничен cache_size, вытесняется давно не использованный"""
+    mock_load_excel.return_value = sample_dataframe_classic
+    loader = DictionaryLoader(cache_size=2)
+
+    loader.load_dictionary(file_path=Path("test.xlsx"), sheet_name="A")
+    loader.load_dictionary(file_path=Path("test.xlsx"), sheet_name="B")
+    loader.load_dictionary(file_path=Path("test.xlsx"), sheet_name="A")  # A — свежий
+    loader.load_dictionary(file_path=Path("test.xlsx"), sheet_name="C")  # вытесняет B
+
+    assert [key.rsplit(":", 1)[1] for key in loader._cache] == ["A", "C"]
+    assert loader.get_cache_info()["max_size"] == 2
+
+
+def test_invalid_cache_size():
+    """Тест: cache_size < 1 недопустим"""
+    with pytest.raises(ValueError, match="cache_size"):
+        DictionaryLoader(cache_size=0)
+
+
 def test_get_cache_info(loader):
     """Тест: получение информации о кэше"""
     test_dict1 = Dictionary(name="Test1")
@@ -41,6 +41,18 @@ def test_dictionary_entry_to_dict():
     assert "metadata" in result
 
 
+def test_dictionary_entry_metadata_not_allocated_by_default():
+    """Тест: metadata по умолчанию None, в to_dict() — пустой словарь"""
+    entry = DictionaryEntry(code=1, name="A", dictionary_type="T")
+
+    assert entry.metadata is None
+    assert entry.metadata_or_empty == {}
+    assert entry.to_dict()["metadata"] == {}
+
+    entry_with_meta = DictionaryEntry(code=2, name="B", dictionary_type="T", metadata={"k": 1})
+    assert entry_with_meta.metadata_or_empty == {"k": 1}
+
+
 def test_dictionary_entry_str_repr():
     """Тест методов __str__ и __repr__"""
     entry = DictionaryEntry(
@@ -150,6 +162,30 @@ def test_dictionary_get_random():
         empty_dict.get_random()
 
 
+def test_dictionary_models_use_slots():
+    """Тест: модели справочников не хранят __dict__ на экземпляр"""
+    entry = DictionaryEntry(code=10410001, name="PACL", dictionary_type="PRODUCT_TYPE")
+    dictionary = Dictionary(name="PRODUCT_TYPE", entries=[entry])
+
+    assert not hasattr(entry, "__dict__")
+    assert not hasattr(dictionary, "__dict__")
+    with pytest.raises(AttributeError):
+        entry.unknown_attr = 1
+
+
+def test_dictionary_lookup_on_empty_and_small():
+    """Тест поиска в пустом справочнике и справочнике из одной записи"""
+    empty_dict = Dictionary(name="EMPTY")
+    assert empty_dict.get_by_code(10410001) is None
+    assert empty_dict.get_by_name("PACL") is None
+
+    entry = DictionaryEntry(code=10410001, name="PACL", dictionary_type="PRODUCT_TYPE")
+    small_dict = Dictionary(name="PRODUCT_TYPE", entries=[entry])
+    assert small_dict.get_by_code(10410001) is entry
+    assert small_dict.get_by_name("PACL") is entry
+    assert small_dict.get_by_code(10410002) is None
+
+
 def test_dictionary_get_all_codes_names():
     """Тест методов get_all_codes() и get_all_names()"""
     dictionary = Dictionary(
@@ -161,10 +197,100 @@ def test_dictionary_get_all_codes_names():
     )
 
     codes = dictionary.get_all_codes()
-    assert codes == [10410001, 10410002]
+    assert codes == (10410001, 10410002)
 
     names = dictionary.get_all_names()
-    assert names == ["PACL", "TOPUP"]
+    assert names == ("PACL", "TOPUP")
+
+
+def test_dictionary_get_all_codes_cached_and_invalidated():
+    """Тест: get_all_codes() кэшируется и сбрасывается при добавлении записей"""
+    dictionary = Dictionary(name="T")
+    dictionary.add_entry(DictionaryEntry(code=1, name="A", dictionary_type="T"))
+
+    assert dictionary.get_all_codes() is dictionary.get_all_codes()
+
+    dictionary.add_entry(DictionaryEntry(code=2, name="B", dictionary_type="T"))
+    assert dictionary.get_all_codes() == (1, 2)
+
+    dictionary.extend([DictionaryEntry(code=3, name="C", dictionary_type="T")])
+    assert dictionary.get_all_names() == ("A", "B", "C")
+
+
+
+def test_dictionary_direct_entries_edit_requires_reindex():
+    """Тест: правка entries напрямую видна после reindex() (как и для индексов)"""
+    dictionary = Dictionary(name="T")
+    dictionary.extend_columns([1, 2], ["A", "B"], "T")
+    assert dictionary.get_all_codes() == (1, 2)
+
+    # Замена записи той же длины: кэши и индексы не отслеживают entries
+    dictionary.entries[0] = DictionaryEntry(code=9, name="Z", dictionary_type="T")
+    assert dictionary.get_all_codes() == (1, 2)
+    assert dictionary.get_by_code(9) is None
+
+    dictionary.reindex()
+    assert dictionary.get_all_codes() == (9, 2)
+    assert dictionary.get_all_names() == ("Z", "B")
+    assert dictionary.get_by_code(9).name == "Z"
+    assert dictionary.get_by_code(1) is None
+
+
+def test_dictionary_extend_columns():
+    """Тест extend_columns(): записи, индексы и кэши из параллельных колонок"""
+    dictionary = Dictionary(name="T")
+    dictionary.extend_columns([1, 2], ["A", "B"], "T", ["desc A", "desc B"])
+
+    assert dictionary.get_by_code(2).name == "B"
+    assert dictionary.get_by_name("A").description == "desc A"
+    assert dictionary.get_all_codes() == (1, 2)
+
+    dictionary.extend_columns([3], ["C"], "T")
+    assert dictionary.get_by_code(3).description == ""
+    assert dictionary.get_all_codes() == (1, 2, 3)
+    assert dictionary.get_all_names() == ("A", "B", "C")
+
+    with pytest.raises(ValueError, match="Длины колонок"):
+        dictionary.extend_columns([4, 5], ["D"], "T")
+
+
+def test_dictionary_contains_codes_batch():
+    """Тест пакетной проверки кодов contains_codes()"""
+    import numpy as np
+
+    dictionary = Dictionary(name="T")
+    assert dictionary.contains_codes([1, 2]).tolist() == [False, False]
+
+    dictionary.extend_columns([30, 10, 20], ["C", "A", "B"], "T")
+    result = dictionary.contains_codes([10, 15, 30, 40, 0])
+    assert result.dtype == bool
+    assert result.tolist() == [True, False, True, False, False]
+    assert dictionary.contains_codes(np.array([20, 21])).tolist() == [True, False]
+    assert dictionary.contains_codes(code for code in (10, 11)).tolist() == [True, False]
+
+    # Новые записи учитываются
+    dictionary.add_entry(DictionaryEntry(code=40, name="D", dictionary_type="T"))
+    assert dictionary.contains_codes([40]).tolist() == [True]
+
+
+def test_dictionary_contains_codes_fractional_and_replaced():
+    """Тест: дробные коды не найдены, замена записи видна после reindex()"""
+    import numpy as np
+
+    dictionary = Dictionary(name="T")
+    dictionary.extend_columns([10410001, 10410002], ["A", "B"], "T")
+
+    assert dictionary.contains_codes([10410001.7, 10410002.0]).tolist() == [False, True]
+    assert dictionary.contains_codes(np.array([10410001.5, np.nan, 1e30])).tolist() == [
+        False, False, False,
+    ]
+    assert dictionary.contains_codes([]).tolist() == []
+    with pytest.raises(TypeError):
+        dictionary.contains_codes(["10410001"])
+
+    dictionary.entries[0] = DictionaryEntry(code=7, name="Z", dictionary_type="T")
+    dictionary.reindex()
+    assert dictionary.contains_codes([10410001, 7]).tolist() == [False, True]
 
 
 def test_dictionary_size_and_empty():
@@ -206,6 +332,11 @@ def test_dictionary_contains():
     assert "PACL" in dictionary  # По названию
     assert 99999 not in dictionary
 
+    # Запись и неподдерживаемые типы
+    assert dictionary.entries[0] in dictionary
+    assert 10410001.0 not in dictionary
+    assert None not in dictionary
+
 
 def test_dictionary_iteration():
     """Тест итерации по справочнику"""
@@ -227,6 +358,22 @@ def test_dictionary_iteration():
     assert collected == entries_list
 
 
+def test_dictionary_extend():
+    """Тест метода extend(): пачка записей + обновление индексов"""
+    dictionary = Dictionary(name="PRODUCT_TYPE")
+    dictionary.add_entry(DictionaryEntry(code=1, name="A", dictionary_type="PRODUCT_TYPE"))
+
+    dictionary.extend(
+        DictionaryEntry(code=code, name=name, dictionary_type="PRODUCT_TYPE")
+        for code, name in [(2, "B"), (3, "C"), (2, "B2")]
+    )
+
+    assert dictionary.size() == 4
+    assert dictionary.get_by_code(3).name == "C"
+    assert dictionary.get_by_code(2).name == "B2"  # последняя запись побеждает
+    assert dictionary.get_by_name("A").code == 1
+
+
 def test_dictionary_to_dict():
     """Тест метода to_dict()"""
     dictionary = Dictionary(
@@ -246,6 +393,34 @@ def test_dictionary_to_dict():
     assert result["entries"][0]["code"] == 10410001
 
 
+def test_dictionary_to_dict_returns_fresh_entries():
+    """Тест: to_dict() отражает правки записей и не разделяет словари между вызовами"""
+    dictionary = Dictionary(name="T")
+    dictionary.add_entry(DictionaryEntry(code=1, name="A", dictionary_type="T"))
+
+    first = dictionary.to_dict()
+    first["entries"][0]["code"] = 999
+    assert dictionary.to_dict()["entries"][0]["code"] == 1
+
+    dictionary.entries[0].name = "B"
+    assert dictionary.to_dict()["entries"][0]["name"] == "B"
+
+
+def test_dictionary_to_json_bytes():
+    """Тест метода to_json_bytes()"""
+    import json
+
+    dictionary = Dictionary(
+        name="PRODUCT_TYPE",
+        entries=[
+            DictionaryEntry(code=10410001, name="ПАКЛ", dictionary_type="PRODUCT_TYPE"),
+        ]
+    )
+
+    assert json.loads(dictionary.to_json_bytes()) == dictionary.to_dict()
+    assert json.loads(dictionary.entries[0].to_json_bytes())["name"] == "ПАКЛ"
+
+
 # ============================================================================
 # ТЕСТЫ: DictionaryEntry — расширенные поля
 # ============================================================================
@@ -0,0 +1,188 @@
+"""
+Unit-тесты для excel_utils.
+Покрывает: загрузку листа Excel, список листов, кэш листов для вспомогательных функций.
+"""
+import json
+import zipfile
+
+import pytest
+from openpyxl import Workbook
+
+import src.utils.excel_utils as excel_utils
+from src.utils.excel_utils import (
+    STRING_DTYPE, load_excel, get_sheet_names,
+    excel_to_dict, excel_to_json, filter_excel_by_column, get_unique_values,
+)
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "PRODUCT_TYPE"
+    sheet.append(["code", "name", "description"])
+    sheet.append([10410001, "PACL", "Кредит наличными"])
+    sheet.append([10410002, "PACC", None])
+    workbook.create_sheet("LOAN_TYPE")
+    file_path = tmp_path / "dictionaries.xlsx"
+    workbook.save(file_path)
+    return file_path
+
+
+class TestLoadExcel:
+    def test_reads_codes_as_strings(self, workbook_path):
+        df = load_excel(workbook_path, sheet_name="PRODUCT_TYPE", dtype=STRING_DTYPE)
+
+        assert list(df["code"]) == ["10410001", "10410002"]
+        assert list(df["name"]) == ["PACL", "PACC"]
+
+    def test_calamine_matches_openpyxl(self, workbook_path, monkeypatch):
+        pytest.importorskip("python_calamine")
+
+        monkeypatch.setattr(excel_utils, "EXCEL_ENGINE", "calamine")
+        fast = load_excel(workbook_path, sheet_name="PRODUCT_TYPE", dtype=STRING_DTYPE)
+        monkeypatch.setattr(excel_utils, "EXCEL_ENGINE", None)
+        reference = load_excel(workbook_path, sheet_name="PRODUCT_TYPE", dtype=STRING_DTYPE)
+
+        assert fast.equals(reference)
+
+
+class TestGetSheetNames:
+    def test_lists_sheets_in_order(self, workbook_path):
+        assert get_sheet_names(workbook_path) == ["PRODUCT_TYPE", "LOAN_TYPE"]
+
+    def test_without_calamine(self, workbook_path, monkeypatch):
+        monkeypatch.setattr(excel_utils, "CALAMINE_AVAILABLE", False)
+
+        assert get_sheet_names(workbook_path) == ["PRODUCT_TYPE", "LOAN_TYPE"]
+
+    def test_non_xlsx_falls_back_to_pandas(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(excel_utils, "CALAMINE_AVAILABLE", False)
+        file_path = tmp_path / "legacy.xls"
+        file_path.write_bytes(b"not a zip archive")
+
+        class FakeExcelFile:
+            sheet_names = ["Лист1"]
+
+            def __init__(self, path):
+                assert path == file_path
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+        monkeypatch.setattr(excel_utils.pd, "ExcelFile", FakeExcelFile)
+
+        assert get_sheet_names(file_path) == ["Лист1"]
+
+    @pytest.mark.parametrize("calamine", [True, False])
+    def test_skips_chartsheets(self, tmp_path, monkeypatch, calamine):
+        if calamine:
+            pytest.importorskip("python_calamine")
+        monkeypatch.setattr(excel_utils, "CALAMINE_AVAILABLE", calamine)
+        workbook = Workbook()
+        workbook.active.title = "DATA"
+        workbook.create_chartsheet("CHART")
+        file_path = tmp_path / "with_chart.xlsx"
+        workbook.save(file_path)
+
+        assert get_sheet_names(file_path) == ["DATA"]
+
+    def test_strict_ooxml_falls_back_to_pandas(self, workbook_path, tmp_path, monkeypatch):
+        monkeypatch.setattr(excel_utils, "CALAMINE_AVAILABLE", False)
+        file_path = tmp_path / "strict.xlsx"
+        with zipfile.ZipFile(workbook_path) as source, zipfile.ZipFile(file_path, "w") as target:
+            for item in source.infolist():
+                data = source.read(item)
+                if item.filename == "xl/workbook.xml":
+                    data = data.replace(
+                        b"http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+                        b"http://purl.oclc.org/ooxml/spreadsheetml/main",
+                    )
+                target.writestr(item, data)
+
+        class FakeExcelFile:
+            sheet_names = ["PRODUCT_TYPE", "LOAN_TYPE"]
+
+            def __init__(self, path):
+                assert path == file_path
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+        monkeypatch.setattr(excel_utils.pd, "ExcelFile", FakeExcelFile)
+
+        assert get_sheet_names(file_path) == ["PRODUCT_TYPE", "LOAN_TYPE"]
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            get_sheet_names(tmp_path / "missing.xlsx")
+
+
+class TestExcelToDict:
+    def test_missing_cells_become_none(self, workbook_path):
+        records = excel_to_dict(workbook_path, sheet_name="PRODUCT_TYPE")
+
+        assert records == [
+            {"code": 10410001, "name": "PACL", "description": "Кредит наличными"},
+            {"code": 10410002, "name": "PACC", "description": None},
+        ]
+        assert type(records[0]["code"]) is int
+
+
+class TestExcelToJson:
+    @pytest.mark.parametrize("indent", [2, 4, 0, None])
+    def test_matches_json_dump_of_records(self, workbook_path, tmp_path, indent):
+        output_path = tmp_path / "out" / "product_type.json"
+
+        excel_to_json(workbook_path, output_path, sheet_name="PRODUCT_TYPE", indent=indent)
+
+        records = excel_to_dict(workbook_path, sheet_name="PRODUCT_TYPE")
+        expected = json.dumps(records, indent=indent, ensure_ascii=False)
+        assert output_path.read_text(encoding="utf-8") == expected
+
+    def test_empty_sheet(self, workbook_path, tmp_path):
+        output_path = tmp_path / "loan_type.json"
+
+        excel_to_json(workbook_path, output_path, sheet_name="LOAN_TYPE")
+
+        assert json.loads(output_path.read_text(encoding="utf-8")) == []
+
+
+class TestSheetCache:
+    def test_helpers_parse_workbook_once(self, workbook_path, monkeypatch):
+        excel_utils._read_sheet_cached.cache_clear()
+        calls = []
+        real_load_excel = excel_utils.load_excel
+        monkeypatch.setattr(
+            excel_utils, "load_excel",
+            lambda *args, **kwargs: calls.append(args) or real_load_excel(*args, **kwargs)
+        )
+
+        records = excel_to_dict(workbook_path, sheet_name="PRODUCT_TYPE")
+        filtered = filter_excel_by_column(workbook_path, "name", "PACC", "PRODUCT_TYPE")
+        codes = get_unique_values(workbook_path, "code", sheet_name="PRODUCT_TYPE")
+
+        assert len(calls) == 1
+        assert records[0]["name"] == "PACL"
+        assert list(filtered["code"]) == [10410002]
+        assert codes == [10410001, 10410002]
+        excel_utils._read_sheet_cached.cache_clear()
+
+    def test_changed_file_is_read_again(self, workbook_path):
+        excel_utils._read_sheet_cached.cache_clear()
+        assert get_unique_values(workbook_path, "name", "PRODUCT_TYPE") == ["PACL", "PACC"]
+
+        workbook = Workbook()
+        workbook.active.title = "PRODUCT_TYPE"
+        workbook.active.append(["name"])
+        workbook.active.append(["PACREACT"])
+        workbook.save(workbook_path)
+
+        assert get_unique_values(workbook_path, "name", "PRODUCT_TYPE") == ["PACREACT"]
+        excel_utils._read_sheet_cached.cache_clear()
@@ -25,6 +25,11 @@ class TestJsonDictionaryLoaderLoad:
         product_type = dictionaries["PRODUCT_TYPE"]
         assert product_type.size() == 2  # 3 entries - 1 deleted = 2
 
+    def test_load_interns_dictionary_type(self, loader):
+        dictionaries, _ = loader.load(SAMPLE_JSON)
+        first, second = dictionaries["PRODUCT_TYPE"].entries[:2]
+        assert first.dictionary_type is second.dictionary_type
+
     def test_load_filter_deleted(self, loader):
         dictionaries, _ = loader.load(SAMPLE_JSON, filter_deleted=True)
         product_type = dictionaries["PRODUCT_TYPE"]
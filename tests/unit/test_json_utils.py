@@ -0,0 +1,237 @@
+"""
+Unit-тесты для json_utils.
+Покрывает: загрузку и сохранение JSON, валидацию по схеме, форматирование,
+работу со схемами.
+"""
+import json
+
+import pytest
+
+import src.utils.json_utils as json_utils
+from src.utils.json_utils import (
+    load_json, save_json, pretty_print_json, minify_json,
+    validate_json_schema, get_validation_errors, merge_schemas,
+    extract_required_fields, extract_required_fields_set,
+)
+
+SAMPLE = {
+    "loanRequest": {"creditAmt": 100000, "rate": 12.5, "items": [{"code": "ПК"}, [], {}]},
+    "flag": True,
+    "empty": None,
+}
+
+
+class TestLoadJson:
+    def test_loads_utf8_file(self, tmp_path):
+        file_path = tmp_path / "schema.json"
+        data = {"type": "object", "description": "Заявка", "properties": {"a": {"maxLength": 10}}}
+        file_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+        assert load_json(file_path) == data
+
+    def test_accepts_what_stdlib_accepts(self, tmp_path):
+        # orjson отвергает NaN и целые больше 64 бит, stdlib json — нет
+        file_path = tmp_path / "loose.json"
+        file_path.write_text('{"big": 123456789012345678901234567890, "nan": NaN}')
+
+        data = load_json(file_path)
+
+        assert data["big"] == 123456789012345678901234567890
+        assert data["nan"] != data["nan"]
+
+    def test_invalid_json_raises_json_decode_error(self, tmp_path):
+        file_path = tmp_path / "broken.json"
+        file_path.write_text('{"a": ', encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            load_json(file_path)
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_json(tmp_path / "missing.json")
+
+
+class TestSaveJson:
+    def test_matches_stdlib_output(self, tmp_path):
+        file_path = tmp_path / "out" / "scenario.json"
+
+        save_json(SAMPLE, file_path)
+
+        assert file_path.read_text(encoding="utf-8") == json.dumps(
+            SAMPLE, indent=2, ensure_ascii=False
+        )
+
+    @pytest.mark.parametrize("kwargs", [{"indent": 4}, {"ensure_ascii": True}])
+    def test_stdlib_only_options(self, tmp_path, kwargs):
+        file_path = tmp_path / "scenario.json"
+
+        save_json(SAMPLE, file_path, **kwargs)
+
+        expected = json.dumps(SAMPLE, **{"indent": 2, "ensure_ascii": False, **kwargs})
+        assert file_path.read_text(encoding="utf-8") == expected
+
+    def test_int_wider_than_64_bits(self, tmp_path):
+        file_path = tmp_path / "big.json"
+
+        save_json({"big": 2 ** 70}, file_path)
+
+        assert load_json(file_path) == {"big": 2 ** 70}
+
+
+class TestValidation:
+    SCHEMA = {
+        "type": "object",
+        "required": ["code"],
+        "properties": {"code": {"type": "integer"}, "name": {"type": "string"}},
+    }
+
+    def test_valid_data(self):
+        assert validate_json_schema({"code": 1, "name": "PACL"}, self.SCHEMA) is True
+
+    def test_invalid_data_raises_validation_error(self):
+        from jsonschema import ValidationError
+
+        with pytest.raises(ValidationError):
+            validate_json_schema({"name": 1}, self.SCHEMA)
+
+    def test_invalid_schema_raises_schema_error(self):
+        from jsonschema import SchemaError
+
+        with pytest.raises(SchemaError):
+            validate_json_schema({}, {"type": "no-such-type"})
+
+    def test_get_validation_errors(self):
+        errors = get_validation_errors({"code": "x", "name": 1}, self.SCHEMA)
+
+        assert len(errors) == 2
+
+    def test_validator_built_once_per_schema(self):
+        from jsonschema import ValidationError
+
+        json_utils._get_validator.cache_clear()
+        schema = json.loads(json.dumps(self.SCHEMA))
+
+        for code in range(5):
+            validate_json_schema({"code": code}, schema)
+        # Изменение схемы после вызова дает новый ключ, а не устаревший валидатор
+        schema["properties"]["code"]["type"] = "string"
+
+        with pytest.raises(ValidationError):
+            validate_json_schema({"code": 1}, schema)
+        assert json_utils._get_validator.cache_info().misses == 2
+
+
+class TestFormatting:
+    def test_pretty_print_matches_stdlib(self):
+        assert pretty_print_json(SAMPLE) == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+    def test_minify_matches_stdlib(self):
+        assert minify_json(SAMPLE) == json.dumps(
+            SAMPLE, separators=(",", ":"), ensure_ascii=False
+        )
+
+
+class TestMergeSchemas:
+    def test_override_wins_and_nested_dicts_merge(self):
+        base = {"type": "object", "properties": {"a": {"type": "string", "maxLength": 5}}}
+        override = {"properties": {"a": {"maxLength": 10}, "b": {"type": "integer"}}}
+
+        merged = merge_schemas(base, override)
+
+        assert merged == {
+            "type": "object",
+            "properties": {
+                "a": {"type": "string", "maxLength": 10},
+                "b": {"type": "integer"},
+            },
+        }
+        assert base["properties"]["a"]["maxLength"] == 5
+
+    def test_untouched_subtrees_are_shared(self):
+        base = {"properties": {"a": {"type": "string"}, "b": {"type": "integer"}}}
+
+        merged = merge_schemas(base, {"properties": {"a": {"maxLength": 1}}})
+
+        assert merged["properties"]["b"] is base["properties"]["b"]
+        assert merged["properties"] is not base["properties"]
+
+    def test_empty_nested_override_keeps_base_subtree(self):
+        base = {"properties": {"a": {"type": "string"}}, "required": ["a"]}
+
+        merged = merge_schemas(base, {"properties": {}, "required": []})
+
+        assert merged == {"properties": {"a": {"type": "string"}}, "required": []}
+        assert merged["properties"] is base["properties"]
+        assert merged is not base
+
+    def test_deep_schema_without_recursion_limit(self):
+        import sys
+
+        depth = sys.getrecursionlimit() + 100
+        base = current_base = {}
+        override = current_override = {}
+        for _ in range(depth):
+            current_base["n"] = current_base = {"base": True}
+            current_override["n"] = current_override = {}
+        current_override["override"] = True
+
+        merged = merge_schemas(base, override)
+
+        for _ in range(depth):
+            merged = merged["n"]
+        assert merged == {"base": True, "override": True}
+
+
+class TestExtractRequiredFields:
+    def test_shared_subschema_reported_under_each_parent(self):
+        address = {"type": "object", "required": ["city"], "properties": {"city": {}}}
+        schema = {
+            "type": "object",
+            "required": ["home"],
+            "properties": {"home": address, "work": address, "name": {"type": "string"}},
+        }
+
+        assert extract_required_fields(schema) == ["home", "home/city", "work/city"]
+        assert extract_required_fields(schema, prefix="client") == [
+            "client/home", "client/home/city", "client/work/city",
+        ]
+
+    def test_nested_order_is_depth_first(self):
+        schema = {
+            "required": ["a"],
+            "properties": {
+                "a": {"type": "object", "required": ["x"], "properties": {
+                    "x": {"type": "object", "required": ["y"]},
+                }},
+                "b": {"type": "object", "required": ["z"]},
+            },
+        }
+
+        assert extract_required_fields(schema) == ["a", "a/x", "a/x/y", "b/z"]
+
+    def test_array_items_objects_included(self):
+        schema = {
+            "required": ["pledges"],
+            "properties": {
+                "pledges": {
+                    "type": "array",
+                    "items": {"type": "object", "required": ["pledgeType"]},
+                },
+                "codes": {"type": "array", "items": {"type": "string"}},
+                "tuple": {"type": "array", "items": [{"type": "object", "required": ["x"]}]},
+            },
+        }
+
+        assert extract_required_fields(schema) == ["pledges", "pledges[]/pledgeType"]
+
+    def test_set_variant_matches_list(self):
+        schema = {
+            "required": ["a", "b"],
+            "properties": {"a": {"type": "object", "required": ["x"]}},
+        }
+
+        required = extract_required_fields_set(schema)
+
+        assert required == frozenset(extract_required_fields(schema))
+        assert "a/x" in required
+        assert "x" not in required
@@ -88,3 +88,88 @@ def test_log_to_file():
 
     # Проверяем, что сообщение записалось
     assert "Тестовое сообщение для проверки записи в файл" in content
+
+
+def test_rotated_log_compressed_in_background(tmp_path):
+    """Тест: ротированный лог сжимается в zip, исходный файл удаляется"""
+    import zipfile
+    from src.utils.logger import _compress_in_background
+
+    rotated = tmp_path / "app.2026-01-01_00-00-00_000000.log"
+    rotated.write_text("строка лога\n", encoding="utf-8")
+
+    _compress_in_background(str(rotated)).result(timeout=10)
+
+    assert not rotated.exists()
+    with zipfile.ZipFile(f"{rotated}.zip") as archive:
+        assert archive.read(rotated.name).decode("utf-8") == "строка лога\n"
+
+
+def test_rotated_log_compressed_synchronously_after_shutdown(tmp_path, monkeypatch):
+    """Тест: если исполнитель остановлен, лог сжимается в вызывающем потоке"""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.utils import logger as logger_module
+
+    stopped = ThreadPoolExecutor(max_workers=1)
+    stopped.shutdown()
+    monkeypatch.setattr(logger_module, "_compression_executor", stopped)
+
+    rotated = tmp_path / "app.2026-01-01_00-00-00_000000.log"
+    rotated.write_text("строка лога\n", encoding="utf-8")
+
+    future = logger_module._compress_in_background(str(rotated))
+
+    assert future.done()
+    assert not rotated.exists()
+    assert (tmp_path / f"{rotated.name}.zip").exists()
+
+
+def test_compression_error_reported_to_stderr(tmp_path, capsys):
+    """Тест: ошибка фонового сжатия выводится в stderr"""
+    from src.utils.logger import _compress_in_background
+
+    missing = tmp_path / "missing.log"
+
+    future = _compress_in_background(str(missing))
+    future.exception(timeout=10)
+    # Обратный вызов выполняется в потоке исполнителя после завершения задачи
+    _compress_in_background(str(tmp_path / "other.log")).exception(timeout=10)
+
+    assert f"Не удалось сжать лог {missing}" in capsys.readouterr().err
+
+
+def test_log_function_call_debug_messages():
+    """Тест: при DEBUG декоратор пишет аргументы и результат"""
+    from loguru import logger
+
+    messages = []
+    handler_id = logger.add(lambda msg: messages.append(msg.record["message"]), level="DEBUG")
+    try:
+        @log_function_call
+        def join(a, sep="-"):
+            return {"joined": sep.join(a)}
+
+        join(["x", "y"], sep="+")
+    finally:
+        logger.remove(handler_id)
+
+    assert messages == [
+        f"{Icon.CONFIG} Вызов функции: join() с args=(['x', 'y'],), kwargs={{'sep': '+'}}",
+        f"{Icon.SUCCESS} Функция join() завершена. Результат: {{'joined': 'x+y'}}",
+    ]
+
+
+def test_log_function_call_skips_repr_below_debug():
+    """Тест: без DEBUG repr результата не вычисляется"""
+
+    class NoRepr:
+        def __repr__(self):
+            raise AssertionError("repr вычислен при выключенном DEBUG")
+
+        __str__ = __repr__
+
+    @log_function_call
+    def make():
+        return NoRepr()
+
+    assert isinstance(make(), NoRepr)
@@ -4,7 +4,7 @@
 import pytest
 from pathlib import Path
 from datetime import datetime
-from src.models.scenario_models import ScenarioMetadata, Scenario
+from src.models.scenario_models import ScenarioMetadata, Scenario, _parse_path
 
 
 # ============================================================================
@@ -45,6 +45,46 @@ def test_scenario_metadata_tags():
     assert len(metadata.tags) == 1  # Не должно дублироваться
 
 
+def test_scenario_metadata_tags_from_init_and_direct_append():
+    """Тест: теги из конструктора и добавленные напрямую в tags тоже видны"""
+    metadata = ScenarioMetadata(
+        name="test",
+        version="072",
+        call="Call1",
+        tags=["smoke"]
+    )
+    assert metadata.has_tag("smoke") is True
+
+    metadata.tags.append("regress")
+    assert metadata.has_tag("regress") is True
+
+    metadata.add_tag("regress")
+    assert metadata.tags == ["smoke", "regress"]
+
+
+def test_scenario_metadata_tags_after_same_length_reassignment():
+    """Тест: замена списка tags той же длины видна в has_tag/add_tag"""
+    metadata = ScenarioMetadata(name="test", version="072", call="Call1", tags=["y"])
+
+    metadata.tags = ["x"]
+
+    assert metadata.has_tag("x") is True
+    assert metadata.has_tag("y") is False
+    metadata.add_tag("x")
+    assert metadata.tags == ["x"]
+
+
+def test_scenario_metadata_tags_after_remove_and_append():
+    """Тест: удаление и добавление тега напрямую в tags"""
+    metadata = ScenarioMetadata(name="test", version="072", call="Call1", tags=["a", "b"])
+
+    metadata.tags.remove("a")
+    metadata.tags.append("c")
+
+    assert metadata.has_tag("c") is True
+    assert metadata.has_tag("a") is False
+
+
 def test_scenario_metadata_update_timestamp():
     """Тест метода update_timestamp()"""
     metadata = ScenarioMetadata(
@@ -150,6 +190,26 @@ def test_scenario_get_field_value_with_arrays():
     assert scenario.get_field_value("loanRequest/items[1]/value") == 200
 
 
+def test_parse_path_segments_are_cached():
+    """Тест разбора пути на сегменты и его кэширования"""
+    _parse_path.cache_clear()
+
+    segments = _parse_path("loanRequest/items[1]/value")
+    assert segments == (("loanRequest", None), ("items", 1), ("value", None))
+
+    assert _parse_path("loanRequest/items[1]/value") is segments
+    assert _parse_path.cache_info().hits == 1
+
+
+def test_parse_path_indexes_and_errors():
+    """Тест разбора индексов массивов в пути"""
+    assert _parse_path("a/items[12]/b[0]") == (("a", None), ("items", 12), ("b", 0))
+    assert _parse_path("plain") == (("plain", None),)
+
+    with pytest.raises(ValueError):
+        _parse_path("items[x]")
+
+
 def test_scenario_set_field_value():
     """Тест метода set_field_value()"""
     metadata = ScenarioMetadata(name="test", version="072", call="Call1")
@@ -182,6 +242,21 @@ def test_scenario_set_field_value_with_arrays():
     assert len(scenario.data["loanRequest"]["items"]) == 2
 
 
+def test_scenario_set_field_value_grows_arrays_with_distinct_items():
+    """Тест: расширение массива создаёт отдельные объекты, а не общие ссылки"""
+    metadata = ScenarioMetadata(name="test", version="072", call="Call1")
+    scenario = Scenario(metadata=metadata, data={})
+
+    scenario.set_field_value("loanRequest/items[3]/value", 1)
+    items = scenario.data["loanRequest"]["items"]
+    assert len(items) == 4
+    assert items[:3] == [{}, {}, {}]
+    assert items[0] is not items[1]
+
+    scenario.set_field_value("loanRequest/codes[2]", 7)
+    assert scenario.data["loanRequest"]["codes"] == [None, None, 7]
+
+
 def test_scenario_has_field():
     """Тест метода has_field()"""
     metadata = ScenarioMetadata(name="test", version="072", call="Call1")
@@ -200,6 +275,27 @@ def test_scenario_has_field():
     assert scenario.has_field("loanRequest/nonExistent") is False
 
 
+def test_scenario_has_field_edge_cases():
+    """Тест has_field() для массивов, None и несовместимых типов"""
+    metadata = ScenarioMetadata(name="test", version="072", call="Call1")
+    data = {
+        "loanRequest": {
+            "items": [{"value": 100}],
+            "comment": None,
+            "creditAmt": 100000,
+        }
+    }
+
+    scenario = Scenario(metadata=metadata, data=data)
+
+    assert scenario.has_field("loanRequest/items[0]/value") is True
+    assert scenario.has_field("loanRequest/items[-1]/value") is True
+    assert scenario.has_field("loanRequest/items[1]/value") is False
+    assert scenario.has_field("loanRequest/comment") is True
+    assert scenario.has_field("loanRequest/creditAmt/nested") is False
+    assert scenario.has_field("loanRequest/creditAmt[0]") is False
+
+
 def test_scenario_delete_field():
     """Тест метода delete_field()"""
     metadata = ScenarioMetadata(name="test", version="072", call="Call1")
@@ -222,6 +318,24 @@ def test_scenario_delete_field():
     assert scenario.delete_field("loanRequest/nonExistent") is False
 
 
+def test_scenario_delete_field_arrays_and_misses():
+    """Тест delete_field() для элементов массивов и отсутствующих путей"""
+    metadata = ScenarioMetadata(name="test", version="072", call="Call1")
+    data = {"loanRequest": {"items": [{"value": 1}, {"value": 2}], "creditAmt": 100}}
+    scenario = Scenario(metadata=metadata, data=data)
+
+    assert scenario.delete_field("loanRequest/items[0]") is True
+    assert scenario.data["loanRequest"]["items"] == [{"value": 2}]
+
+    assert scenario.delete_field("loanRequest/items[5]") is False
+    assert scenario.delete_field("loanRequest/items[0]/missing") is False
+    assert scenario.delete_field("loanRequest/creditAmt/nested") is False
+    assert scenario.delete_field("missing/creditAmt") is False
+
+    assert scenario.delete_field("loanRequest/items[0]/value") is True
+    assert scenario.data["loanRequest"]["items"] == [{}]
+
+
 def test_scenario_to_dict():
     """Тест метода to_dict()"""
     metadata = ScenarioMetadata(name="test", version="072", call="Call1")
@@ -248,3 +362,24 @@ def test_scenario_to_full_dict():
     assert "data" in result
     assert result["metadata"]["name"] == "test"
     assert result["data"] == data
+
+
+def test_scenario_to_json_bytes():
+    """Тест метода to_json_bytes()"""
+    import json
+
+    metadata = ScenarioMetadata(name="test", version="072", call="Call1")
+    scenario = Scenario(metadata=metadata, data={"loanRequest": {"creditAmt": 100000}})
+
+    assert json.loads(scenario.to_json_bytes()) == scenario.to_full_dict()
+
+
+def test_scenario_metadata_to_dict_refreshes_timestamp():
+    """Тест: to_dict() отражает новое updated_at после update_timestamp()"""
+    metadata = ScenarioMetadata(name="test", version="072", call="Call1")
+    metadata.updated_at = datetime(2025, 1, 1, 12, 0)
+    assert metadata.to_dict()["updated_at"] == "2025-01-01T12:00:00"
+
+    metadata.update_timestamp()
+    assert metadata.to_dict()["updated_at"] == metadata.updated_at.isoformat()
+    assert metadata.to_dict()["created_at"] == metadata.created_at.isoformat()
@@ -29,6 +29,26 @@ def test_compare_schemas_added_fields():
     assert diff.added_fields[0].change_type == "added"
 
 
+def test_compare_schemas_preserves_schema_order():
+    """Тест: изменения идут в порядке полей схем (детерминированно)"""
+    comparator = SchemaComparator()
+
+    old_schema = {
+        path: FieldMetadata(path=path, name=path, field_type="string")
+        for path in ["z", "m", "a", "keep"]
+    }
+    new_schema = {
+        path: FieldMetadata(path=path, name=path, field_type="string")
+        for path in ["keep", "y", "b", "x"]
+    }
+
+    diff = comparator.compare(old_schema, new_schema)
+
+    assert [c.path for c in diff.added_fields] == ["y", "b", "x"]
+    assert [c.path for c in diff.removed_fields] == ["z", "m", "a"]
+    assert diff.modified_fields == []
+
+
 def test_compare_schemas_added_required_field():
     """Тест: добавление обязательного поля"""
     comparator = SchemaComparator()
@@ -328,6 +348,30 @@ def test_fields_differ_identical():
     assert comparator._fields_differ(field1, field2) is False
 
 
+def test_fields_differ_ignores_non_contract_attributes():
+    """Тест: описание, сообщение условия и порядок ограничений не считаются изменением"""
+    comparator = SchemaComparator()
+
+    field1 = FieldMetadata(
+        path="test",
+        name="test",
+        field_type="string",
+        description="Старое описание",
+        condition=ConditionalRequirement(expression="#this.a == 1", message="Старое"),
+        constraints={"maxLength": 10, "pattern": "^a$"}
+    )
+    field2 = FieldMetadata(
+        path="test",
+        name="test",
+        field_type="string",
+        description="Новое описание",
+        condition=ConditionalRequirement(expression="#this.a == 1", message="Новое"),
+        constraints={"pattern": "^a$", "maxLength": 10}
+    )
+
+    assert comparator._fields_differ(field1, field2) is False
+
+
 def test_fields_differ_different_type():
     """Тест: разные типы полей"""
     comparator = SchemaComparator()
@@ -368,6 +412,23 @@ def test_fields_differ_different_required():
     assert comparator._fields_differ(field1, field2) is True
 
 
+def test_analyze_constraint_changes_is_ordered():
+    """Тест: описание ограничений в порядке ключей (старые, затем новые)"""
+    comparator = SchemaComparator()
+
+    result = comparator._analyze_constraint_changes(
+        {"maxLength": 100, "minLength": 1, "pattern": "^a$"},
+        {"maxLength": 50, "minLength": 2, "maxItems": 3}
+    )
+
+    assert result == (
+        "Максимальная длина ужесточено: 100 → 50; "
+        "Минимальная длина ужесточено: 1 → 2; "
+        "Регулярное выражение удалено (было: ^a$); "
+        "Максимальное количество элементов добавлено: 3"
+    )
+
+
 # ============================================================================
 # ТЕСТЫ: Статистика
 # ============================================================================
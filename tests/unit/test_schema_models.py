@@ -61,6 +61,10 @@ def test_version_info_status_checks():
     assert deprecating.is_future() is False
     assert deprecating.is_deprecated() is True
 
+    # Выведено из эксплуатации
+    deprecated = VersionInfo(version="069", status=VersionStatus.DEPRECATED)
+    assert deprecated.is_deprecated() is True
+
 
 def test_version_info_str_repr():
     """Тест методов __str__ и __repr__"""
@@ -144,6 +148,14 @@ def test_conditional_requirement_with_dq_code():
     assert cond.dq_code == 12345
 
 
+def test_conditional_requirement_uses_slots():
+    """Тест: ConditionalRequirement без __dict__ (по одному на каждое УО поле)"""
+    cond = ConditionalRequirement(expression="notNull(#this.taxNumber)")
+
+    assert not hasattr(cond, "__dict__")
+    assert cond.message == "notNull(taxNumber)"
+
+
 def test_conditional_requirement_str_repr():
     """Тест методов __str__ и __repr__"""
     cond = ConditionalRequirement(
@@ -297,6 +309,23 @@ def test_field_metadata_type_checks():
     assert complex_array.is_complex() is True
 
 
+def test_field_metadata_interns_type_and_dictionary():
+    """Тест: field_type и dictionary интернируются, нехешируемый тип не ломает проверки"""
+    import sys
+
+    field_type = "".join(["str", "ing"])
+    dictionary = "".join(["PRODUCT", "_TYPE"])
+    field_meta = FieldMetadata(
+        path="field1", name="field1", field_type=field_type, dictionary=dictionary
+    )
+    assert field_meta.field_type is sys.intern("string")
+    assert field_meta.dictionary is sys.intern("PRODUCT_TYPE")
+
+    union_type = FieldMetadata(path="field2", name="field2", field_type=["string", "null"])
+    assert union_type.is_primitive() is False
+    assert union_type.is_complex() is False
+
+
 def test_field_metadata_dictionary():
     """Тест работы со справочниками"""
     # С справочником
@@ -334,6 +363,12 @@ def test_field_metadata_constraints():
     assert field_meta.get_min_length() == 5
     assert field_meta.get_pattern() == "^[A-Z]+$"
 
+    # Геттеры читают актуальные constraints, а не снимок при создании
+    field_meta.constraints["maxLength"] = 5
+    del field_meta.constraints["pattern"]
+    assert field_meta.get_max_length() == 5
+    assert field_meta.get_pattern() is None
+
 
 def test_field_metadata_requirement_status():
     """Тест метода get_requirement_status()"""
@@ -363,6 +398,11 @@ def test_field_metadata_requirement_status():
     )
     assert optional.get_requirement_status() == "Н"
 
+    # Статус следует за изменением флагов после создания
+    optional.is_conditional = True
+    assert optional.get_requirement_status() == "УО"
+    assert "УО" in str(optional)
+
 
 def test_field_metadata_str_repr():
     """Тест методов __str__ и __repr__ (ОБНОВЛЕН)"""
@@ -447,6 +487,25 @@ def test_field_change_breaking_changes():
     assert added.is_breaking_change() is False
 
 
+def test_field_change_breaking_is_memoized():
+    """Тест: is_breaking_change() вычисляется один раз на экземпляр"""
+    change = FieldChange(
+        path="field1",
+        change_type="modified",
+        changes={"required": "Н → О"}
+    )
+    assert change._breaking_cache is None
+
+    assert change.is_breaking_change() is True
+    assert change._breaking_cache is True
+
+    # Кэш не участвует в сравнении и repr
+    assert change == FieldChange(
+        path="field1", change_type="modified", changes={"required": "Н → О"}
+    )
+    assert "_breaking_cache" not in repr(change)
+
+
 def test_field_change_severity():
     """Тест метода get_severity()"""
     # Критичное изменение
@@ -559,6 +618,20 @@ def test_schema_diff_breaking_changes():
     assert diff.get_breaking_changes()[0] == breaking_change
 
 
+def test_schema_diff_iter_changes_order():
+    """Тест iter_changes(): порядок added → removed → modified, без копирования"""
+    diff = SchemaDiff(old_version="070", new_version="072", call="Call1")
+    added = FieldChange(path="a", change_type="added")
+    removed = FieldChange(path="r", change_type="removed")
+    modified = FieldChange(path="m", change_type="modified", changes={"type": "a → b"})
+    diff.modified_fields.append(modified)
+    diff.removed_fields.append(removed)
+    diff.added_fields.append(added)
+
+    assert list(diff.iter_changes()) == [added, removed, modified]
+    assert diff.count_breaking_changes() == 1
+
+
 def test_schema_diff_statistics():
     """Тест метода get_statistics()"""
     diff = SchemaDiff(
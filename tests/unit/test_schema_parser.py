@@ -1,6 +1,10 @@
 """
 Тесты для парсера JSON Schema
 """
+import json
+
+import pytest
+
 from src.parsers.schema_parser import SchemaParser
 from src.models.schema_models import FieldMetadata, ConditionalRequirement
 
@@ -240,6 +244,134 @@ def test_parse_array_schema():
     assert "users[]/name" in fields
 
 
+def test_parse_schema_preserves_depth_first_order():
+    """Тест: поля идут в порядке обхода в глубину (поле, затем его вложенные)"""
+    parser = SchemaParser()
+    fields = parser.parse_schema(get_nested_schema())
+
+    paths = list(fields)
+    assert paths.index("user") < paths.index("user/firstName")
+    assert paths.index("user/address") < paths.index("user/address/city")
+    assert paths.index("user/address/city") < paths.index("user/address/street")
+
+
+def test_parse_schema_interns_paths_and_names():
+    """Тест: пути и имена полей двух разборов — одни и те же объекты строк"""
+    first = SchemaParser().parse_schema(get_nested_schema())
+    second = SchemaParser().parse_schema(get_nested_schema())
+
+    for (path1, meta1), (path2, meta2) in zip(first.items(), second.items()):
+        assert path1 is path2
+        assert meta1.path is meta2.path
+        assert meta1.name is meta2.name
+
+
+def test_parse_deeply_nested_schema_without_recursion_limit():
+    """Тест: глубина вложенности не ограничена лимитом рекурсии Python"""
+    import sys
+
+    depth = sys.getrecursionlimit() + 100
+    schema = current = {"type": "object", "properties": {}}
+    for _ in range(depth):
+        nested = {"type": "object", "properties": {}}
+        current["properties"]["n"] = nested
+        current = nested
+
+    fields = SchemaParser().parse_schema(schema)
+
+    assert len(fields) == depth
+    assert "/".join(["n"] * depth) in fields
+
+
+def test_parse_schema_with_null_required():
+    """Тест: "required": null не ломает парсинг (все поля необязательные)"""
+    schema = {
+        "type": "object",
+        "required": None,
+        "properties": {
+            "user": {
+                "type": "object",
+                "required": None,
+                "properties": {"name": {"type": "string"}},
+            },
+        },
+    }
+
+    fields = SchemaParser().parse_schema(schema)
+
+    assert fields["user"].is_required is False
+    assert fields["user/name"].is_required is False
+
+
+def test_parse_field_derives_name_from_path():
+    """Тест: без явного имени оно берется из последнего сегмента пути"""
+    parser = SchemaParser()
+
+    assert parser._parse_field("loanRequest/items[]", {"type": "array"}, False).name == "items"
+    assert parser._parse_field("creditAmt", {"type": "integer"}, True).name == "creditAmt"
+
+
+def test_parse_nested_schema_logs_once_per_call():
+    """Тест: число сообщений лога не зависит от глубины схемы"""
+    from loguru import logger
+
+    schema = current = {"type": "object", "properties": {}}
+    for _ in range(50):
+        nested = {"type": "object", "properties": {}}
+        current["properties"]["n"] = nested
+        current = nested
+
+    messages = []
+    sink_id = logger.add(lambda message: messages.append(message.record["message"]))
+    try:
+        SchemaParser().parse_schema(schema)
+    finally:
+        logger.remove(sink_id)
+
+    assert sum("Начало парсинга" in m for m in messages) == 1
+    assert sum("Парсинг завершен" in m for m in messages) == 1
+
+
+def test_parse_schema_with_cyclic_and_shared_subschemas():
+    """Тест: общая подсхема парсится в каждом месте, цикл не зацикливает парсер"""
+    address = {"type": "object", "properties": {"city": {"type": "string"}}}
+    node = {"type": "object", "properties": {"value": {"type": "integer"}}}
+    node["properties"]["next"] = node  # Рекурсивная ссылка на саму себя
+    schema = {
+        "type": "object",
+        "properties": {
+            "home": address,
+            "work": address,
+            "node": node,
+        }
+    }
+
+    fields = SchemaParser().parse_schema(schema)
+
+    assert "home/city" in fields
+    assert "work/city" in fields
+    assert "node/value" in fields
+    assert "node/next" in fields
+    assert "node/next/value" not in fields
+
+
+def test_parse_root_array_schema():
+    """Тест: корневой массив объектов парсится с префиксом []"""
+    schema = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "integer"}}
+        }
+    }
+
+    fields = SchemaParser().parse_schema(schema)
+
+    assert list(fields) == ["[]/id"]
+    assert fields["[]/id"].is_required is True
+
+
 def test_parse_schema_with_dictionary():
     """Тест: парсинг схемы со справочниками"""
     parser = SchemaParser()
@@ -336,6 +468,15 @@ def test_extract_array_constraints():
 # УДАЛЕНО: test_compare_schemas_required_change()
 
 
+def test_schema_parser_has_no_comparison_methods():
+    """Тест: сравнение схем живет только в SchemaComparator"""
+    from src.core.schema_comparator import SchemaComparator
+
+    for name in ("compare_schemas", "_fields_differ", "_detect_field_changes"):
+        assert not hasattr(SchemaParser, name)
+    assert hasattr(SchemaComparator, "compare")
+
+
 # ============================================================================
 # ТЕСТЫ: Утилитарные методы (УДАЛЕНЫ - методы больше не существуют)
 # ============================================================================
@@ -499,3 +640,101 @@ class TestSchemaParserDQFields:
         assert fields["name"].always_required_dq_code is None
         assert fields["name"].conditional_dq_code is None
         assert fields["name"].dictionary_dq_code is None
+
+
+# ============================================================================
+# ТЕСТЫ: Кэш load_schema
+# ============================================================================
+
+def test_load_schema_reuses_cached_result(tmp_path, monkeypatch):
+    """Тест: неизмененный файл повторно не читается, даже другим парсером"""
+    import src.parsers.schema_parser as schema_parser_module
+
+    SchemaParser.clear_cache()
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(get_simple_schema()), encoding="utf-8")
+
+    calls = []
+    real_load_json = schema_parser_module.load_json
+    monkeypatch.setattr(
+        schema_parser_module, "load_json", lambda path: calls.append(path) or real_load_json(path)
+    )
+
+    first = SchemaParser().load_schema(schema_path)
+    first.pop("name")  # Изменение результата не должно испортить кэш
+    second = SchemaParser().load_schema(schema_path)
+
+    assert len(calls) == 1
+    assert set(second) == {"name", "age", "email"}
+    SchemaParser.clear_cache()
+
+
+def test_load_schema_cached_metadata_not_shared(tmp_path):
+    """Тест: изменение метаданных поля не видно следующему вызову load_schema"""
+    SchemaParser.clear_cache()
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps({
+        "type": "object",
+        "required": ["code"],
+        "properties": {
+            "code": {"type": "string", "maxLength": 10, "enum": ["A", "B"]},
+        },
+    }), encoding="utf-8")
+
+    for _ in range(2):  # первый вызов разбирает файл, второй берет из кэша
+        field = SchemaParser().load_schema(schema_path)["code"]
+        field.is_required = False
+        field.constraints["maxLength"] = 1
+        field.constraints["enum"].append("C")
+
+    fresh = SchemaParser().load_schema(schema_path)["code"]
+    assert fresh.is_required is True
+    assert fresh.constraints == {"maxLength": 10, "enum": ["A", "B"]}
+    SchemaParser.clear_cache()
+
+
+def test_load_schema_cache_invalidated_on_file_change(tmp_path):
+    """Тест: измененный файл разбирается заново"""
+    SchemaParser.clear_cache()
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(get_simple_schema()), encoding="utf-8")
+    assert "user" not in SchemaParser().load_schema(schema_path)
+
+    schema_path.write_text(json.dumps(get_nested_schema()), encoding="utf-8")
+
+    assert "user/address/city" in SchemaParser().load_schema(schema_path)
+    SchemaParser.clear_cache()
+
+
+# ============================================================================
+# ТЕСТЫ: Потоковый парсинг
+# ============================================================================
+
+def test_stream_schema_matches_load_schema(tmp_path, monkeypatch):
+    """Тест: stream_schema() даёт тот же результат, что load_schema()"""
+    pytest.importorskip("ijson")
+
+    schema = get_nested_schema()
+    schema["properties"]["score"] = {"type": "number", "maximum": 99.5}
+    # Корневой required после properties: потоковый парсер должен его учесть
+    schema["required"] = schema.pop("required", [])
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(schema), encoding="utf-8")
+
+    monkeypatch.setattr(SchemaParser, "STREAM_THRESHOLD", 0)
+    streamed = SchemaParser().stream_schema(schema_path)
+    loaded = SchemaParser().load_schema(schema_path)
+
+    assert list(streamed) == list(loaded)
+    assert streamed == loaded
+    assert isinstance(streamed["score"].constraints["maximum"], float)
+
+
+def test_stream_schema_small_file_falls_back_to_load(tmp_path):
+    """Тест: маленький файл читается через load_schema()"""
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(get_simple_schema()), encoding="utf-8")
+
+    fields = SchemaParser().stream_schema(schema_path)
+
+    assert set(fields) == {"name", "age", "email"}